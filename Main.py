@@ -1,114 +1,440 @@
 #Main.py
 import sys
 import os
+import re
+import glob
+import json
+import time
+import argparse
 from datetime import datetime
-from Account import USERNAME, PASSWORD
-from file_reader import get_all_docx_files, extract_linkedin_links, extract_phone_number
-from linkedin_checker import init_driver, login_linkedin, check_linkedin_profile
-from output_manager import display_results_terminal, save_results_html, save_results_excel
+from file_reader import iter_docx_files, iter_shard, load_exclusions, stream_contact_info
+from journal import read_journal, JOURNAL_FILE, WATCH_JOURNAL_FILE
+from pipeline import Verifier, CheckerStartError, RETRY_ATTEMPTS
+from result_table import ResultTable
+from run_history import (RunHistory, HISTORY_FILE, RUN_COMPLETE, RUN_INTERRUPTED, RUN_FAILED, MERGE_PREFIX,
+                         common_directory, diff_results)
+from scheduler import Budget
+from watcher import watch_folder
+from checker_backend import SeleniumChecker, HttpChecker, MockChecker
+from checker_pool import CheckerPool
+from output_manager import display_results_terminal, save_results_html, save_results_excel, ThrottledWriter
 from logging_config import setup_logger
-from utils import timing
+from metrics import METRICS
+from utils import timing, parse_duration, parse_shard, positive_int, positive_float
 import logging
 
 logger = setup_logger()
 logging.disable(logging.CRITICAL)
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATUS_DIR = os.path.join(BASE_DIR, "Status")
+HISTORY_PATH = os.path.join(STATUS_DIR, HISTORY_FILE)
+EXCLUSION_FILE = os.path.join(BASE_DIR, "EX.txt")
+LIVE_REPORT_NAME = "linkedin_results_live"
+MERGED_REPORT_NAME = "linkedin_results_merged"
+# Watch mode rewrites the live HTML per batch, but the workbook takes seconds on a large tree
+LIVE_EXCEL_INTERVAL = 300.0
+SHARD_DIR_PATTERN = re.compile(r"^shard-(\d+)-of-(\d+)$")
+SHARD_INFO_FILE = "shard.json"
+
+def selenium_checker(**options):
+    """
+    SeleniumChecker logged in with the credentials from Account.py.
+    Account is imported here so test and offline runs work without credentials.
+    """
+    from Account import USERNAME, PASSWORD
+    return SeleniumChecker(USERNAME, PASSWORD, headless=False, **options) #You Can Change it to "True" to make the browser hidded
+
 @timing(logger)
-def process_files(folder_path, test_mode=False): 
-    files = get_all_docx_files(folder_path)
-    logger.info(f"Found {len(files)} DOCX files")
-
-    exclusion_file = os.path.join(os.path.dirname(__file__), "EX.txt")
-    exclude_names = set()
-    if os.path.exists(exclusion_file):
-        with open(exclusion_file, "r", encoding="utf-8") as f:
-            exclude_names = set(line.strip() for line in f if line.strip())
-
-    results = []
-    driver = None
-    if not test_mode:
-        driver = init_driver(headless=False) #You Can Change it to "True" to make the browser hidded
-        try:
-            login_linkedin(driver, USERNAME, PASSWORD)
-        except Exception as e:
-            if driver:
-                driver.quit()
-            return []
-
-    for file_path in files:
-        file_name = os.path.basename(file_path)
-        folder_name = os.path.basename(os.path.dirname(file_path))
-        if file_name in exclude_names or folder_name in exclude_names:
-            continue
+def process_files(folder_path, test_mode=False, workers=None, full_scan=False, max_age=None, checker=None,
+                  resume=False, status_dir=STATUS_DIR, budget=None, retries=RETRY_ATTEMPTS, shard=None): 
+    # Excluded folders are pruned during the walk, and files stream to the parser as they are found
+    files = iter_docx_files(folder_path, load_exclusions(EXCLUSION_FILE))
+    if shard:
+        files = iter_shard(files, folder_path, shard)
+
+    if checker is None:
+        checker = MockChecker() if test_mode else selenium_checker()
+    verifier = Verifier(checker, status_dir, max_age=max_age, resume=resume, full_scan=full_scan, retries=retries)
 
-        phone = extract_phone_number(file_path)
-        links = extract_linkedin_links(file_path)
-        if not links:
-            results.append({
-                "file_name": file_name,
-                "full_path": file_path,
-                "folder_name": folder_name,
-                "phone": phone,
-                "link": "",
-                "name": "",
-                "status": False
-            })
+    # Parsing runs in a process pool; the browser only starts once a link needs checking
+    records = stream_contact_info(files, workers=workers, lookup=verifier.lookup)
+
+    try:
+        if budget:
+            # A budgeted run checks in staleness order instead of walk order, so runs rotate through the corpus
+            deferred = verifier.handle_budgeted(records, budget)
+            if deferred:
+                print(f"[INFO] Budget reached: {deferred} profiles left for the next run.")
+        elif checker.concurrency > 1:
+            # Links go to the checker pool as their files are parsed
+            verifier.handle_concurrent(records)
         else:
-            for link in links:
-                try:
-                    if test_mode:
-                        status, name = True, "Mock Name"
-                    else:
-                        status, name = check_linkedin_profile(driver, link)
-                except Exception:
-                    status, name = False, ""
-                results.append({
-                    "file_name": file_name,
-                    "full_path": file_path,
-                    "folder_name": folder_name,
-                    "phone": phone,
-                    "link": link,
-                    "name": name,
-                    "status": status
-                })
-
-    if driver:
-        driver.quit()
-
-    # Remove duplicates
-    unique_results = []
-    seen = set()
-    for r in results:
-        key = (r["file_name"], r["link"])
-        if key not in seen:
-            seen.add(key)
-            unique_results.append(r)
-
-    # Ensure 'status' field exists for all
-    for r in unique_results:
-        if "status" not in r:
-            r["status"] = False
-
-    return unique_results
+            for record in records:
+                verifier.handle(record)
+        # Timeouts and crashed sessions are retried once everything else is done
+        verifier.retry_failed(budget)
+    except CheckerStartError as e:
+        # main() rebuilds what was verified so far from the journal
+        print(f"[ERROR] Could not start the profile checker: {e}")
+        raise
+    finally:
+        verifier.close()
+
+    # Already deduplicated on insert: one row per (full_path, link)
+    return verifier.results
 
 @timing(logger)
-def save_results(results):
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    status_dir = os.path.join(base_dir, "Status")
+def save_results(results, output_name=None, status_dir=STATUS_DIR):
+    os.makedirs(status_dir, exist_ok=True)
+
+    with METRICS.time("report_html"):
+        save_results_html(results, status_dir, output_name)
+    with METRICS.time("report_excel"):
+        save_results_excel(results, status_dir, output_name)
+
+def watch(folder_path, test_mode=False, workers=None, max_age=None, checker=None, poll_interval=5.0,
+          use_polling=False, retries=RETRY_ATTEMPTS, excel_interval=LIVE_EXCEL_INTERVAL):
+    """
+    Daemon mode: verify the folder once, then keep one checker session open (started on the
+    first link to check) and verify CVs as they arrive. Status/linkedin_results_live.html is rewritten
+    after every batch; linkedin_results_live.xlsx in the background, at most every excel_interval seconds.
+    """
+    if checker is None:
+        checker = MockChecker() if test_mode else selenium_checker()
+    verifier = Verifier(checker, STATUS_DIR, max_age=max_age, retries=retries, journal_file=WATCH_JOURNAL_FILE)
+
+    def write_excel(results):
+        with METRICS.time("report_excel"):
+            save_results_excel(results, STATUS_DIR, LIVE_REPORT_NAME)
+
+    # The watch loop never waits for the workbook; a new CV is in the HTML report within seconds
+    excel = ThrottledWriter(write_excel, excel_interval)
+
+    def on_update(results):
+        try:
+            with METRICS.time("report_html"):
+                save_results_html(results, STATUS_DIR, LIVE_REPORT_NAME)
+        except OSError as e:
+            print(f"[WARNING] Could not update the live HTML report: {e}")
+        excel.update(results)
+
+    try:
+        watch_folder(folder_path, verifier, load_exclusions(EXCLUSION_FILE), on_update, workers=workers,
+                     poll_interval=poll_interval, use_polling=use_polling)
+    except CheckerStartError as e:
+        print(f"[ERROR] Could not start the profile checker: {e}")
+    except KeyboardInterrupt:
+        print("[INFO] Watch mode stopped.")
+    finally:
+        excel.close()
+        verifier.close()
+        export_metrics()
+
+def build_checker(backend, base_url=None, fast=False, test_mode=False, session_dir=None, cookie_file=None,
+                  sessions=1, rate_limit=None):
+    """
+    Return the profile checker for a --backend name (None keeps the process_files default).
+    sessions > 1 or a rate limit wraps the backend in a CheckerPool.
+    """
+    pooled = sessions > 1 or rate_limit is not None
+
+    def make(index=0):
+        if backend == "http":
+            return HttpChecker(base_url=base_url)
+        if backend == "mock" or (backend is None and test_mode):
+            return MockChecker()
+        if backend == "selenium" or base_url or fast or session_dir or cookie_file or pooled:
+            # Chrome locks its profile directory, so each session gets its own
+            user_data_dir = f"{session_dir}_{index}" if session_dir and index else session_dir
+            return selenium_checker(base_url=base_url, fast=fast, user_data_dir=user_data_dir,
+                                    cookie_file=cookie_file)
+        return None
+
+    if pooled:
+        return CheckerPool(make, size=sessions, rate_per_minute=rate_limit)
+    return make()
+
+def export_metrics(status_dir=STATUS_DIR):
+    """
+    Write the per-stage timings and counters of this run to Status/metrics.json and metrics.prom.
+    """
+    summary = METRICS.export(status_dir)
+    for stage, stats in summary["stages"].items():
+        logger.info(f"{stage}: n={stats['count']} total={stats['total']:.2f}s "
+                    f"p50={stats['p50']:.3f}s p95={stats['p95']:.3f}s max={stats['max']:.3f}s")
+    for cache, rate in summary["hit_rates"].items():
+        logger.info(f"{cache} hit rate: {rate:.1%}")
+
+def main(folder_path, test_mode=False, full_scan=False, max_age=None, checker=None, resume=False, budget=None,
+         retries=RETRY_ATTEMPTS, shard=None):
+    started_at = time.time()
+    # Each shard keeps its own manifest, cache, journal and reports, so shards never share a file
+    status_dir = shard_status_dir(shard) if shard else STATUS_DIR
+    root = os.path.abspath(folder_path)
+    # Mock and offline-server runs say nothing about real profiles, so they stay out of the history
+    live = checker.live if checker else not test_mode
+    if shard:
+        write_shard_info(status_dir, shard, root, live, resume)
+    try:
+        try:
+            results = process_files(folder_path, test_mode=test_mode, full_scan=full_scan, max_age=max_age,
+                                    checker=checker, resume=resume, status_dir=status_dir, budget=budget,
+                                    retries=retries, shard=shard)
+        except (KeyboardInterrupt, Exception) as e:
+            # Reports are still built from whatever reached the journal, and the run is never recorded as complete
+            print(f"[WARNING] Run interrupted ({type(e).__name__}). Saving partial reports; use --resume to continue.")
+            partial = ResultTable(read_journal(os.path.join(status_dir, JOURNAL_FILE)))
+            state = RUN_FAILED if isinstance(e, CheckerStartError) else RUN_INTERRUPTED
+            if partial:
+                save_results(partial, status_dir=status_dir)
+                if live:
+                    record_run(root, partial, started_at, state, status_dir)
+            if isinstance(e, (KeyboardInterrupt, CheckerStartError)):
+                return
+            raise
+        display_results_terminal(results)
+        save_results(results, status_dir=status_dir)
+        if live:
+            record_run(root, results, started_at, status_dir=status_dir)
+    finally:
+        export_metrics(status_dir)
+
+def shard_status_dir(shard):
+    return os.path.join(STATUS_DIR, f"shard-{shard[0]}-of-{shard[1]}")
+
+def write_shard_info(status_dir, shard, root, live, resume=False):
+    """
+    Record next to a shard's journal what it scanned and whether its checker was live,
+    so merge() knows whether the combined results may enter the run history.
+    """
+    if resume:
+        # A resumed journal is only live if every part of it was
+        previous = read_shard_info(status_dir)
+        live = live and bool(previous and previous.get("live"))
     os.makedirs(status_dir, exist_ok=True)
+    with open(os.path.join(status_dir, SHARD_INFO_FILE), "w", encoding="utf-8") as f:
+        json.dump({"shard": f"{shard[0]}/{shard[1]}", "root": root, "live": live}, f)
+
+def read_shard_info(source):
+    """
+    Return the shard.json of a shard folder (or of the folder holding a journal file), or None.
+    """
+    folder = source if os.path.isdir(source) else os.path.dirname(os.path.abspath(source))
+    try:
+        with open(os.path.join(folder, SHARD_INFO_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def record_run(root, results, started_at, state=RUN_COMPLETE, status_dir=STATUS_DIR, base=None):
+    """
+    Keep the results of this run in Status/history.db for the report command.
+    base is the scanned folder the result directories are relative to (default: root).
+    """
+    history_path = os.path.join(status_dir, HISTORY_FILE)
+    history = RunHistory(history_path)
+    try:
+        with METRICS.time("history_write"):
+            run_id = history.record_run(root, results, started_at, state, base)
+        print(f"[INFO] Results stored as run {run_id} in {history_path}")
+    finally:
+        history.close()
+
+def merge(sources=None, output_name=None):
+    """
+    Combine the results of shard runs (shard folders from other hosts copied under Status/,
+    or their journal.jsonl files) into one deduplicated result set, one HTML/Excel pair
+    and one run in Status/history.db. With no sources, every Status/shard-* folder is used.
+    """
+    started_at = time.time()
+    if not sources:
+        sources = sorted(glob.glob(os.path.join(STATUS_DIR, "shard-*-of-*")))
+    if not sources:
+        print("[ERROR] No shard results to merge.")
+        return None
+
+    results = ResultTable()
+    shards = {}
+    roots = set()
+    live = True
+    for source in sources:
+        journal_path = os.path.join(source, JOURNAL_FILE) if os.path.isdir(source) else source
+        if not os.path.exists(journal_path):
+            print(f"[WARNING] No results found in {source}")
+            continue
+        rows = read_journal(journal_path)
+        results.extend(rows)
+        info = read_shard_info(source)
+        live = live and bool(info and info.get("live"))
+        if info and info.get("root"):
+            roots.add(info["root"])
+        print(f"[INFO] {source}: {len(rows)} results")
+        match = SHARD_DIR_PATTERN.search(os.path.basename(os.path.normpath(source)))
+        if match:
+            shards.setdefault(int(match.group(2)), set()).add(int(match.group(1)))
+
+    for count, indexes in shards.items():
+        missing = sorted(set(range(1, count + 1)) - indexes)
+        if missing:
+            print(f"[WARNING] Shards {', '.join(f'{i}/{count}' for i in missing)} are missing from the merge.")
+
+    print(f"[INFO] Merged {len(results)} unique results from {len(sources)} shards.")
+    save_results(results, output_name or MERGED_REPORT_NAME, STATUS_DIR)
+    # Like a single run, merged mock or offline results must never become the latest run or a diff baseline
+    if live:
+        # Shards of one scan share its root; folder filters in reports are relative to it
+        base = roots.pop() if len(roots) == 1 else common_directory(r.full_path for r in results)
+        record_run(MERGE_PREFIX + ", ".join(os.path.abspath(source) for source in sources), results, started_at,
+                   status_dir=STATUS_DIR, base=base)
+    else:
+        print("[INFO] Not recorded in the run history: not every shard was checked against LinkedIn.")
+    return results
 
-    save_results_html(results, status_dir)
-    save_results_excel(results, status_dir)
+def report(run_id=None, folder=None, status=None, diff_run=None, diff_since=None, output_format="both",
+           output_name=None, list_runs=False):
+    """
+    Build reports from Status/history.db without checking anything: one run (default: the
+    latest complete one), optionally one folder and/or status, or the changes since another run.
+    """
+    history = RunHistory(HISTORY_PATH)
+    try:
+        if list_runs:
+            for rid, root, started, state, count in history.runs():
+                print(f"{rid:>5}  {datetime.fromtimestamp(started):%Y-%m-%d %H:%M}  {state:<11} {count:>7} results  {root}")
+            return
 
-def main(folder_path, test_mode=False):
-    results = process_files(folder_path, test_mode=test_mode)
-    display_results_terminal(results)
-    save_results(results)
+        run_id = run_id or history.latest_run()
+        if run_id is None or history.started_at(run_id) is None:
+            print(f"[ERROR] No such run recorded in {HISTORY_PATH}.")
+            return
+        results = history.load(run_id, folder, status)
+        output_name = output_name or f"linkedin_report_run{run_id}"
+
+        if diff_run is not None or diff_since is not None:
+            # The baseline is always older than the run it is compared with
+            before = min(time.time() - (diff_since or 0), history.started_at(run_id) or time.time())
+            base_id = diff_run or history.latest_run(before=before)
+            if base_id is None:
+                print("[ERROR] No earlier run to compare with.")
+                return
+            added, removed, changed = diff_results(history.load(base_id, folder, status), results)
+            for row in added:
+                print(f"+ {row.full_path}  {row.link or '-'}  {'✔' if row.status else '✖'}")
+            for row in removed:
+                print(f"- {row.full_path}  {row.link or '-'}")
+            for row in changed:
+                print(f"~ {row.full_path}  {row.link}  {'✖ → ✔' if row.status else '✔ → ✖'}")
+            print(f"[INFO] Run {base_id} → {run_id}: {len(added)} new, {len(removed)} removed, "
+                  f"{len(changed)} changed status")
+            # The diff reports list the current state of every new or changed row
+            results = ResultTable(list(added) + list(changed))
+            output_name = f"linkedin_diff_run{base_id}_run{run_id}"
+
+        if output_format == "terminal":
+            display_results_terminal(results)
+        if output_format in ("html", "both"):
+            save_results_html(results, STATUS_DIR, output_name)
+        if output_format in ("excel", "both"):
+            save_results_excel(results, STATUS_DIR, output_name)
+    finally:
+        history.close()
+
+COMMANDS = ("scan", "report", "merge")
+
+def parse_args(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # scan is the default command, so "Main.py <folder> --test" keeps working
+    if not argv or argv[0] not in COMMANDS + ("-h", "--help"):
+        argv = ["scan"] + argv
+
+    parser = argparse.ArgumentParser(description="Verify LinkedIn links found in ATS resumes (DOCX).")
+    commands = parser.add_subparsers(dest="command", metavar="{scan,report,merge}")
+
+    scan_parser = commands.add_parser("scan", help="Verify the CVs of a folder (default when no command is given)",
+                                      description="Verify LinkedIn links found in ATS resumes (DOCX).")
+    scan_parser.add_argument("folder_path", help="Folder containing the DOCX files (scanned recursively)")
+    scan_parser.add_argument("--test", action="store_true", help="Do not open LinkedIn, return mock results")
+    scan_parser.add_argument("--full-scan", action="store_true", help="Parse every file, ignoring the scan manifest")
+    scan_parser.add_argument("--max-age", type=parse_duration, default=None,
+                             help="Reuse profile checks younger than this (e.g. 12h, 7d) and evict older ones")
+    scan_parser.add_argument("--backend", choices=["selenium", "http", "mock"], default=None,
+                             help="Profile checker backend (default: selenium, or mock with --test)")
+    scan_parser.add_argument("--base-url", default=None,
+                             help="Load profiles from this server instead of LinkedIn (see fake_linkedin_server.py)")
+    scan_parser.add_argument("--fast", action="store_true",
+                             help="Fast verify: eager page loads, no images/fonts/media, no fixed sleeps or scrolling")
+    scan_parser.add_argument("--session-dir", default=None,
+                             help="Persistent Chrome profile directory; login only happens when the session expired")
+    scan_parser.add_argument("--cookie-file", default=None,
+                             help="JSON cookie jar to restore the LinkedIn session from and save it to")
+    scan_parser.add_argument("--resume", action="store_true",
+                             help="Continue an interrupted run from Status/journal.jsonl instead of starting over")
+    scan_parser.add_argument("--budget-profiles", type=int, default=None,
+                             help="Check at most N profiles, stalest first, and leave the rest for the next run")
+    scan_parser.add_argument("--budget-minutes", type=float, default=None,
+                             help="Stop checking after M minutes, stalest profiles first")
+    scan_parser.add_argument("--sessions", type=positive_int, default=1,
+                             help="Number of checker sessions (browsers) verifying profiles in parallel")
+    scan_parser.add_argument("--rate-limit", type=positive_float, default=None,
+                             help="Maximum profile checks per minute across all sessions")
+    scan_parser.add_argument("--retries", type=int, default=RETRY_ATTEMPTS,
+                             help=f"Rounds of end-of-run retries for timeouts and browser crashes "
+                                  f"(default: {RETRY_ATTEMPTS})")
+    scan_parser.add_argument("--shard", type=parse_shard, default=None,
+                             help="Only process shard i of n (e.g. 2/4), chosen by a stable hash of each file's "
+                                  "relative path; results go to Status/shard-i-of-n/ (see the merge command)")
+    scan_parser.add_argument("--watch", action="store_true",
+                             help="Keep running and verify CVs as they are created or modified")
+    scan_parser.add_argument("--poll-interval", type=float, default=5.0,
+                             help="Seconds between rescans when watch mode polls (default: 5)")
+    scan_parser.add_argument("--polling", action="store_true",
+                             help="Force polling in watch mode even if watchdog is installed")
+    scan_parser.add_argument("--excel-interval", type=parse_duration, default=LIVE_EXCEL_INTERVAL,
+                             help="Minimum time between rewrites of the live Excel report in watch mode "
+                                  "(e.g. 90s, 10m; default: 5m)")
+
+    report_parser = commands.add_parser("report", help="Build reports from the run history",
+                                        description="Build reports from the run history without re-checking profiles.")
+    report_parser.add_argument("--list", action="store_true", help="List the recorded runs")
+    report_parser.add_argument("--run", type=int, default=None, help="Run id (default: the latest complete run)")
+    report_parser.add_argument("--folder", default=None, help="Only results under this folder, relative to the scanned folder "
+                                    "(e.g. \"Client Alpha\" or \"Client Alpha/August2025\")")
+    report_parser.add_argument("--status", choices=["valid", "invalid"], default=None,
+                               help="Only valid or invalid results")
+    report_parser.add_argument("--diff-run", type=int, default=None, help="Show what changed since this run id")
+    report_parser.add_argument("--diff-since", type=parse_duration, default=None,
+                               help="Show what changed since the last run older than this (e.g. 7d)")
+    report_parser.add_argument("--format", choices=["both", "html", "excel", "terminal"], default="both",
+                               help="Output format (default: HTML and Excel)")
+    report_parser.add_argument("--output", default=None, help="Report file name without extension")
+
+    merge_parser = commands.add_parser("merge", help="Combine the results of --shard runs",
+                                       description="Combine the results of --shard runs into one set of reports.")
+    merge_parser.add_argument("sources", nargs="*",
+                              help="Shard folders or journal.jsonl files (default: every Status/shard-* folder)")
+    merge_parser.add_argument("--output", default=None, help=f"Report file name without extension "
+                                                              f"(default: {MERGED_REPORT_NAME})")
+
+    return parser.parse_args(argv)
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python main.py <folder_path> [--test]")
-        sys.exit(1)
-    folder_path = sys.argv[1]
-    test_mode = "--test" in sys.argv
-    main(folder_path, test_mode=test_mode)
+    args = parse_args()
+    if args.command == "merge":
+        merge(args.sources, args.output)
+    elif args.command == "report":
+        status = None if args.status is None else args.status == "valid"
+        report(args.run, args.folder, status, diff_run=args.diff_run, diff_since=args.diff_since,
+               output_format=args.format, output_name=args.output, list_runs=args.list)
+    else:
+        checker = build_checker(args.backend, args.base_url, fast=args.fast, test_mode=args.test,
+                                session_dir=args.session_dir, cookie_file=args.cookie_file,
+                                sessions=args.sessions, rate_limit=args.rate_limit)
+        if args.watch:
+            watch(args.folder_path, test_mode=args.test, max_age=args.max_age, checker=checker,
+                  poll_interval=args.poll_interval, use_polling=args.polling, retries=args.retries,
+                  excel_interval=args.excel_interval)
+        else:
+            main(args.folder_path, test_mode=args.test, full_scan=args.full_scan, max_age=args.max_age,
+                 checker=checker, resume=args.resume, budget=Budget(args.budget_profiles, args.budget_minutes),
+                 retries=args.retries, shard=args.shard)
@@ -0,0 +1,183 @@
+# benchmarks/generate_corpus.py
+"""
+Build a synthetic corpus of ATS-style CVs for benchmarking.
+
+    python benchmarks/generate_corpus.py ./bench_corpus --files 2000 --seed 7
+
+Documents vary in paragraph count, embedded images, hyperlink relationships,
+LinkedIn URLs split across runs and phone formats, and are spread over nested
+client folders that include EX.txt exclusions (temp folders, LinkedIn.docx, ...).
+"""
+import io
+import os
+import sys
+import zlib
+import shutil
+import random
+import struct
+import argparse
+
+from docx import Document
+from docx.shared import Inches
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+
+FIRST_NAMES = ["Ahmed", "Sara", "Omar", "Lina", "Khalid", "Noura", "Faisal", "Reem", "Yousef", "Huda"]
+LAST_NAMES = ["Al-Qahtani", "Al-Harbi", "Mustafa", "Al-Otaibi", "Hassan", "Al-Zahrani", "Saleh", "Nasser"]
+CLIENTS = ["Client Alpha", "Client Beta", "Gamma Holdings", "Delta Co", "Epsilon Group"]
+MONTHS = ["January2025", "February2025", "March2025", "August2025", "September2025"]
+
+# Names listed in the repository's EX.txt, so the walker and exclusions get exercised
+EXCLUDED_FOLDERS = ["temp", "~TEMP", "~temp"]
+EXCLUDED_FILES = ["LinkedIn.docx", "Cover Letter - en.docx", "Cover Letter - ar.docx"]
+
+LOREM = ("Managed cross-functional teams delivering enterprise projects on time and within budget. "
+         "Led the migration of legacy systems and improved reporting accuracy across departments.")
+
+
+def phone_number(rng):
+    digits = "".join(str(rng.randint(0, 9)) for _ in range(8))
+    style = rng.randrange(7)
+    if style == 0:
+        return f"+966 5{digits[0]} {digits[1:4]} {digits[4:]}"
+    if style == 1:
+        return f"05{digits}"
+    if style == 2:
+        return f"(+966) 5{digits}"
+    if style == 3:
+        return f"+966-5{digits[:2]}-{digits[2:5]}-{digits[5:]}"
+    if style == 4:
+        return f"009665{digits}"
+    if style == 5:
+        return f"+20 1{digits[:2]} {digits[2:5]} {digits[5:]}0"
+    return f"5{digits}"
+
+
+def linkedin_url(rng, slug):
+    variants = [
+        f"linkedin.com/in/{slug}",
+        f"www.linkedin.com/in/{slug}",
+        f"https://www.linkedin.com/in/{slug}/",
+        f"https://sa.linkedin.com/in/{slug}?trk=profile",
+        f"https://linkedin.com/in/{slug.upper()}",
+    ]
+    return rng.choice(variants)
+
+
+def png_bytes(rng, size):
+    """
+    Return an incompressible RGB PNG of roughly `size` x `size` pixels.
+    """
+    raw = b"".join(b"\x00" + rng.randbytes(size * 3) for _ in range(size))
+
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw, 1)) + chunk(b"IEND", b"")
+
+
+def add_hyperlink(paragraph, url, text):
+    r_id = paragraph.part.relate_to(url, RT.HYPERLINK, is_external=True)
+    hyperlink = OxmlElement("w:hyperlink")
+    hyperlink.set(qn("r:id"), r_id)
+    run = OxmlElement("w:r")
+    text_element = OxmlElement("w:t")
+    text_element.text = text
+    run.append(text_element)
+    hyperlink.append(run)
+    paragraph._p.append(hyperlink)
+
+
+def add_split_runs(paragraph, text, rng):
+    """
+    Write text as several runs, the way Word splits edited or spell-checked text.
+    """
+    cuts = sorted(rng.sample(range(1, len(text)), k=min(3, len(text) - 1)))
+    start = 0
+    for cut in cuts + [len(text)]:
+        paragraph.add_run(text[start:cut])
+        start = cut
+
+
+def build_cv(rng, path, index, image_size):
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    slug = f"{first}-{last}-{index}".lower()
+    doc = Document()
+
+    doc.add_paragraph(f"{first} {last}")
+    if rng.random() < 0.85:
+        doc.add_paragraph(f"Phone: {phone_number(rng)}")
+    doc.add_paragraph(f"{first.lower()}.{last.lower()}@example.com")
+
+    link_style = rng.random()
+    if link_style < 0.35:
+        add_split_runs(doc.add_paragraph(), linkedin_url(rng, slug), rng)
+    elif link_style < 0.65:
+        add_hyperlink(doc.add_paragraph("LinkedIn: "), f"https://www.linkedin.com/in/{slug}", "My profile")
+    elif link_style < 0.85:
+        doc.add_paragraph(f"LinkedIn: {linkedin_url(rng, slug)}.")
+    doc.add_paragraph("Riyadh, Saudi Arabia")
+
+    if image_size and rng.random() < 0.4:
+        doc.add_picture(io.BytesIO(png_bytes(rng, image_size)), width=Inches(1.2))
+
+    for _ in range(rng.randint(5, 120)):
+        doc.add_paragraph(LOREM)
+
+    doc.save(path)
+
+
+def generate(output_dir, files, seed=0, image_size=256, duplicates=0.1, excluded=0.05):
+    """
+    Write `files` synthetic CVs under output_dir and return their paths.
+    A `duplicates` share are byte-identical copies placed in other client folders,
+    and an `excluded` share land in folders or under names listed in EX.txt.
+    """
+    rng = random.Random(seed)
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+
+    for index in range(files):
+        folder = os.path.join(output_dir, rng.choice(CLIENTS), rng.choice(MONTHS))
+        if paths and rng.random() < duplicates:
+            source = rng.choice(paths)
+            os.makedirs(folder, exist_ok=True)
+            target = os.path.join(folder, os.path.basename(source))
+            if not os.path.exists(target):
+                shutil.copyfile(source, target)
+                paths.append(target)
+                continue
+
+        file_name = f"CV_{index:06d}.docx"
+        if rng.random() < excluded:
+            if rng.random() < 0.5:
+                folder = os.path.join(folder, rng.choice(EXCLUDED_FOLDERS))
+            else:
+                file_name = rng.choice(EXCLUDED_FILES)
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, file_name)
+        build_cv(rng, path, index, image_size)
+        paths.append(path)
+
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic ATS CV corpus.")
+    parser.add_argument("output_dir")
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--image-size", type=int, default=256, help="Side of embedded images in pixels (0 = none)")
+    parser.add_argument("--duplicates", type=float, default=0.1, help="Share of byte-identical copies")
+    parser.add_argument("--excluded", type=float, default=0.05, help="Share of files hit by EX.txt exclusions")
+    args = parser.parse_args()
+
+    paths = generate(args.output_dir, args.files, args.seed, args.image_size, args.duplicates, args.excluded)
+    print(f"[INFO] Generated {len(paths)} CVs under {args.output_dir}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+# benchmarks/run_benchmarks.py
+"""
+Benchmark the scan, extraction, report and end-to-end stages on a synthetic corpus.
+
+    python benchmarks/run_benchmarks.py --files 1000 --rows 20000
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/<previous>.json
+
+Results are written as JSON to benchmarks/results/ so runs of different versions
+can be compared; --compare flags stages that got slower than --threshold.
+"""
+import io
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import platform
+import argparse
+import tempfile
+import statistics
+import subprocess
+import contextlib
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from generate_corpus import generate
+from file_reader import (get_all_docx_files, extract_contact_info, extract_linkedin_links, extract_phone_number,
+                         read_contact_lines)
+from file_reader import stream_contact_info
+from output_manager import save_results_html, save_results_excel
+from result_table import ResultTable
+from utils import extract_phones
+
+
+def measure(func, repeat, items):
+    """
+    Run func `repeat` times and return timing stats; `items` is the work per call.
+    """
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+        durations.append(time.perf_counter() - started)
+
+    median = statistics.median(durations)
+    return {
+        "repeat": repeat,
+        "items": items,
+        "min": min(durations),
+        "median": median,
+        "mean": statistics.mean(durations),
+        "max": max(durations),
+        "items_per_second": items / median if median else 0.0,
+    }
+
+
+def synthetic_results(count, seed=0):
+    rng = random.Random(seed)
+    results = ResultTable()
+    for i in range(count):
+        folder = f"Client {rng.randrange(40)}"
+        link = f"https://www.linkedin.com/in/candidate-{i}" if rng.random() < 0.9 else ""
+        results.add(os.path.join("Resumes", folder, f"CV_{i:06d}.docx"), f"+9665{rng.randrange(10 ** 8):08d}",
+                    link, bool(link) and rng.random() < 0.8, f"Candidate {i}" if link else "")
+    return results
+
+
+def bench_end_to_end(corpus_dir, work_dir, latency, repeat, items):
+    """
+    process_files with the HTTP backend against the offline stand-in server.
+    """
+    try:
+        import Main
+    except ImportError as e:
+        return {"skipped": f"Main could not be imported: {e}"}
+    from checker_backend import HttpChecker
+    from fake_linkedin_server import start_server, FakeLinkedInConfig
+
+    server, base_url = start_server(config=FakeLinkedInConfig(latency=latency, not_found=0.1, redirect=0.1))
+    try:
+        def run():
+            status_dir = tempfile.mkdtemp(dir=work_dir)
+            Main.process_files(corpus_dir, full_scan=True, checker=HttpChecker(base_url=base_url),
+                               status_dir=status_dir)
+        return measure(run, repeat, items)
+    finally:
+        server.shutdown()
+
+
+def git_version():
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current, previous_path, threshold):
+    with open(previous_path, "r", encoding="utf-8") as f:
+        previous = json.load(f)
+
+    print(f"\nComparison with {previous.get('version')} ({previous.get('timestamp')}):")
+    regressions = 0
+    for name, stats in current["benchmarks"].items():
+        old = previous.get("benchmarks", {}).get(name)
+        if "median" not in stats or not old or "median" not in old:
+            continue
+        ratio = stats["median"] / old["median"] if old["median"] else 0.0
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  <-- REGRESSION"
+            regressions += 1
+        print(f"  {name:<28} {old['median']:.4f}s -> {stats['median']:.4f}s  ({ratio:.2f}x){flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmark suite.")
+    parser.add_argument("--files", type=int, default=300, help="CVs in the synthetic corpus")
+    parser.add_argument("--rows", type=int, default=10000, help="Rows written by the report benchmarks")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--image-size", type=int, default=256)
+    parser.add_argument("--latency", type=float, default=0.005, help="Stand-in server latency for end-to-end")
+    parser.add_argument("--corpus", default=None, help="Reuse an existing corpus instead of generating one")
+    parser.add_argument("--output", default=None, help="Where to write the JSON results")
+    parser.add_argument("--compare", default=None, help="Previous results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="linkedin_bench_")
+    try:
+        corpus_dir = args.corpus
+        if corpus_dir is None:
+            corpus_dir = os.path.join(work_dir, "corpus")
+            print(f"[INFO] Generating {args.files} CVs...")
+            generate(corpus_dir, args.files, seed=args.seed, image_size=args.image_size)
+
+        files = get_all_docx_files(corpus_dir)
+        rows = synthetic_results(args.rows, seed=args.seed)
+        reports_dir = os.path.join(work_dir, "reports")
+        benchmarks = {}
+
+        def run(name, func, items):
+            print(f"[INFO] {name}...")
+            benchmarks[name] = measure(func, args.repeat, items)
+
+        run("get_all_docx_files", lambda: get_all_docx_files(corpus_dir), len(files))
+        run("extract_contact_info", lambda: [extract_contact_info(f) for f in files], len(files))
+        run("extract_links_and_phone", lambda: [(extract_linkedin_links(f), extract_phone_number(f)) for f in files],
+            len(files))
+        run("stream_contact_info", lambda: list(stream_contact_info(files)), len(files))
+        line_groups = [read_contact_lines(f)[0] for f in files]
+        run("extract_phones", lambda: extract_phones(line_groups), len(line_groups))
+        run("save_results_html", lambda: save_results_html(rows, reports_dir), len(rows))
+        run("save_results_excel", lambda: save_results_excel(rows, reports_dir), len(rows))
+        print("[INFO] process_files end-to-end...")
+        benchmarks["process_files_end_to_end"] = bench_end_to_end(corpus_dir, work_dir, args.latency,
+                                                                  args.repeat, len(files))
+
+        report = {
+            "version": git_version(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "corpus": {"files": len(files), "seed": args.seed, "image_size": args.image_size,
+                       "generated": args.corpus is None},
+            "rows": args.rows,
+            "benchmarks": benchmarks,
+        }
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"bench_{datetime.now().strftime('%Y-%m-%d_%H-%M')}_{report['version']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    for name, stats in benchmarks.items():
+        if "median" in stats:
+            print(f"  {name:<28} median {stats['median']:.4f}s  ({stats['items_per_second']:.1f} items/s)")
+        else:
+            print(f"  {name:<28} {stats.get('skipped')}")
+    print(f"[INFO] Results saved to {output}")
+
+    if args.compare:
+        return 1 if compare(report, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
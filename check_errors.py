@@ -0,0 +1,59 @@
+# check_errors.py
+from urllib.parse import urlsplit
+
+# Why a profile check did not verify the profile
+NOT_FOUND = "not-found"              # LinkedIn says the profile does not exist
+REDIRECTED_AWAY = "redirected-away"  # sent somewhere that is not a profile (feed, company page, ...)
+TIMEOUT = "timeout"                  # the page did not load or render in time
+DRIVER_ERROR = "driver-error"        # the browser session failed or crashed
+SESSION_EXPIRED = "session-expired"  # sent to a login wall: our session, not the profile, is the problem
+
+# Worth retrying later: the profile itself may be fine
+TRANSIENT_FAILURES = (TIMEOUT, DRIVER_ERROR, SESSION_EXPIRED)
+# Retried on a fresh session (browser restart and login)
+RESTART_FAILURES = (DRIVER_ERROR, SESSION_EXPIRED)
+
+# Where LinkedIn sends a signed-out browser
+LOGIN_WALL_PATHS = ("/login", "/uas/login", "/authwall", "/checkpoint")
+
+
+class ProfileCheckError(Exception):
+    """
+    Raised by a profile checker when a profile could not be verified; `kind` is one of the failure classes above.
+    """
+
+    def __init__(self, kind, detail=""):
+        super().__init__(f"{kind}: {detail}" if detail else kind)
+        self.kind = kind
+
+    @property
+    def transient(self):
+        return self.kind in TRANSIENT_FAILURES
+
+
+def is_login_wall(url):
+    """
+    True for a login, authwall or checkpoint page, or the signed-out home page.
+    """
+    path = urlsplit(url).path.lower()
+    return path.startswith(LOGIN_WALL_PATHS) or path in ("", "/")
+
+
+def classify_redirect(url):
+    """
+    Failure class for a check that ended on a non-profile URL.
+    """
+    if urlsplit(url).path.lower().startswith("/404"):
+        return NOT_FOUND
+    if is_login_wall(url):
+        return SESSION_EXPIRED
+    return REDIRECTED_AWAY
+
+
+def failure_kind(error):
+    """
+    Failure class of any exception raised by a checker; unexpected ones count as driver errors.
+    """
+    if isinstance(error, ProfileCheckError):
+        return error.kind
+    return DRIVER_ERROR
@@ -0,0 +1,165 @@
+# checker_backend.py
+import re
+import html
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import urlsplit
+from utils import is_profile_url
+from check_errors import ProfileCheckError, classify_redirect, NOT_FOUND, TIMEOUT
+from metrics import METRICS
+
+PROFILE_NAME_PATTERN = re.compile(
+    r"<h1[^>]*class=\"[^\"]*inline t-24 v-align-middle break-words[^\"]*\"[^>]*>(.*?)</h1>",
+    re.IGNORECASE | re.DOTALL
+)
+TAG_PATTERN = re.compile(r"<[^>]+>")
+
+
+def rewrite_base_url(url, base_url):
+    """
+    Point a LinkedIn URL at another server, keeping path and query.
+    e.g. https://www.linkedin.com/in/foo -> http://127.0.0.1:8765/in/foo
+    """
+    if not base_url:
+        return url
+    parts = urlsplit(url)
+    target = base_url.rstrip("/") + parts.path
+    if parts.query:
+        target += "?" + parts.query
+    return target
+
+
+class ProfileChecker:
+    """
+    Interface used by process_files to verify profile links.
+    check(url) returns (status, name) or raises ProfileCheckError with the failure class;
+    start() and close() bracket a run and restart() replaces a crashed session.
+    `live` is True when results reflect real LinkedIn and may be cached.
+    `concurrency` is the number of checks that can be in flight at once.
+    """
+    live = False
+    concurrency = 1
+
+    def start(self):
+        pass
+
+    def check(self, url):
+        raise NotImplementedError
+
+    def restart(self):
+        METRICS.incr("checker_restarts")
+        try:
+            self.close()
+        except Exception:
+            pass
+        self.start()
+
+    def check_many(self, urls):
+        """
+        Check URLs one after another, yielding (url, result, elapsed) where result is
+        (status, name) or the exception the check raised.
+        """
+        for url in urls:
+            started = time.perf_counter()
+            try:
+                result = self.check(url)
+            except Exception as e:
+                result = e
+            yield url, result, time.perf_counter() - started
+
+    def close(self):
+        pass
+
+
+class SeleniumChecker(ProfileChecker):
+    """
+    Undetected Chrome session logged into LinkedIn (the production backend).
+    With base_url set, profiles are loaded from that server instead and no login is done.
+    fast=True uses the eager, resource-blocking driver and check_linkedin_profile_fast.
+    user_data_dir / cookie_file keep the session between runs; login only happens when it expired.
+    Selenium and undetected_chromedriver are only imported when the session starts.
+    """
+
+    def __init__(self, username, password, headless=False, base_url=None, fast=False,
+                 user_data_dir=None, cookie_file=None):
+        self.username = username
+        self.password = password
+        self.headless = headless
+        self.base_url = base_url
+        self.fast = fast
+        self.user_data_dir = user_data_dir
+        self.cookie_file = cookie_file
+        self.live = base_url is None
+        self.driver = None
+
+    def start(self):
+        from linkedin_checker import init_driver, login_linkedin, ensure_logged_in
+        self.driver = init_driver(headless=self.headless, fast=self.fast, user_data_dir=self.user_data_dir)
+        if not self.live:
+            return
+        if self.user_data_dir or self.cookie_file:
+            ensure_logged_in(self.driver, self.username, self.password, cookie_file=self.cookie_file)
+        else:
+            login_linkedin(self.driver, self.username, self.password)
+
+    def check(self, url):
+        from linkedin_checker import check_linkedin_profile, check_linkedin_profile_fast
+        target = rewrite_base_url(url, self.base_url)
+        if self.fast:
+            return check_linkedin_profile_fast(self.driver, target)
+        return check_linkedin_profile(self.driver, target)
+
+    def close(self):
+        if self.driver:
+            if self.live and self.cookie_file:
+                # Keep the jar in step with cookies LinkedIn refreshed during the run
+                try:
+                    from linkedin_checker import save_cookies
+                    save_cookies(self.driver, self.cookie_file)
+                except Exception:
+                    pass
+            driver, self.driver = self.driver, None
+            driver.quit()
+
+
+class HttpChecker(ProfileChecker):
+    """
+    Browserless backend that fetches profile pages over plain HTTP.
+    Meant for the offline stand-in server (fake_linkedin_server.py) to measure throughput.
+    """
+
+    def __init__(self, base_url=None, timeout=10):
+        self.base_url = base_url
+        self.timeout = timeout
+
+    def check(self, url):
+        try:
+            with urllib.request.urlopen(rewrite_base_url(url, self.base_url), timeout=self.timeout) as response:
+                final_url = response.geturl()
+                page = response.read().decode("utf-8", errors="replace")
+        except urllib.error.HTTPError as e:
+            # 429 and 5xx are the server's problem, not the profile's
+            if e.code in (404, 410):
+                # A redirect can end on a missing page too; that is still a redirect away from the profile
+                kind = NOT_FOUND if is_profile_url(e.geturl()) else classify_redirect(e.geturl())
+                raise ProfileCheckError(kind, f"HTTP {e.code}")
+            raise ProfileCheckError(TIMEOUT, f"HTTP {e.code}")
+        except (urllib.error.URLError, OSError) as e:
+            raise ProfileCheckError(TIMEOUT, str(e))
+
+        if not is_profile_url(final_url):
+            raise ProfileCheckError(classify_redirect(final_url))
+
+        match = PROFILE_NAME_PATTERN.search(page)
+        name = html.unescape(TAG_PATTERN.sub("", match.group(1))).strip() if match else ""
+        return True, name
+
+
+class MockChecker(ProfileChecker):
+    """
+    Zero-latency backend used by --test.
+    """
+
+    def check(self, url):
+        return True, "Mock Name"
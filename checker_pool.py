@@ -0,0 +1,224 @@
+# checker_pool.py
+import time
+import queue
+import logging
+import threading
+from checker_backend import ProfileChecker
+from check_errors import failure_kind, RESTART_FAILURES
+from metrics import METRICS
+
+logger = logging.getLogger("LinkedInChecker")
+
+_STOP = object()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: at most `rate` acquisitions per second on average,
+    with bursts of up to `burst`. Shared by every worker of a pool.
+    """
+
+    def __init__(self, rate, burst=1):
+        if rate <= 0:
+            raise ValueError(f"Rate must be greater than zero: {rate!r}")
+        self.rate = rate
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class _Worker:
+    def __init__(self, index, factory):
+        self.index = index
+        self.factory = factory
+        self.checker = factory()
+        self.checks = 0
+        self.busy = 0.0
+        self.restarts = 0
+        self.started = None
+
+    def restart(self):
+        """
+        Replace a crashed session with a fresh checker from the factory.
+        """
+        try:
+            self.checker.close()
+        except Exception:
+            pass
+        self.restarts += 1
+        METRICS.incr("checker_restarts")
+        METRICS.incr(f"checker_worker_{self.index}_restarts")
+        logger.info(f"Checker worker {self.index}: session crashed, starting a new one")
+        self.checker = self.factory()
+        self.checker.start()
+
+
+class CheckerPool(ProfileChecker):
+    """
+    N checker sessions pulling profile URLs from one shared queue.
+    `factory(index)` builds the checker of worker `index` (e.g. a SeleniumChecker,
+    which drives init_driver / check_linkedin_profile). All workers share one
+    token bucket, so the total request rate stays under `rate_per_minute`
+    however many sessions run. A worker whose session crashes (driver-error) is
+    given a new session and retries the URL once; other failures are returned as they are.
+    """
+
+    def __init__(self, factory, size=1, rate_per_minute=None, burst=1):
+        self.size = max(1, size)
+        self.concurrency = self.size
+        self.workers = [_Worker(i, lambda i=i: factory(i)) for i in range(self.size)]
+        self.live = self.workers[0].checker.live
+        self.limiter = TokenBucket(rate_per_minute / 60.0, burst) if rate_per_minute else None
+        self.tasks = queue.Queue(maxsize=self.size * 2)
+        self.done = queue.Queue()
+        self.threads = []
+        self.lock = threading.Lock()
+        self.in_flight = 0
+
+    def start(self):
+        # Sessions start in parallel; a session that cannot start fails the pool
+        errors = []
+
+        def start_one(worker):
+            try:
+                worker.checker.start()
+            except Exception as e:
+                errors.append(e)
+
+        starters = [threading.Thread(target=start_one, args=(w,)) for w in self.workers]
+        for thread in starters:
+            thread.start()
+        for thread in starters:
+            thread.join()
+        if errors:
+            raise errors[0]
+
+        for worker in self.workers:
+            worker.started = time.monotonic()
+            thread = threading.Thread(target=self._run, args=(worker,), daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def _run(self, worker):
+        while True:
+            url = self.tasks.get()
+            if url is _STOP:
+                return
+
+            # Everything that can fail stays in the try, so an error becomes this URL's result
+            # instead of ending the worker thread (and leaving completed(wait=True) waiting forever)
+            started = time.perf_counter()
+            try:
+                if self.limiter:
+                    self.limiter.acquire()
+                    started = time.perf_counter()
+                try:
+                    result = worker.checker.check(url)
+                except Exception as e:
+                    if failure_kind(e) not in RESTART_FAILURES:
+                        raise
+                    worker.restart()
+                    # The retry is another request to LinkedIn, so it needs its own token
+                    if self.limiter:
+                        self.limiter.acquire()
+                    result = worker.checker.check(url)
+            except Exception as e:
+                result = e
+            elapsed = time.perf_counter() - started
+
+            worker.checks += 1
+            worker.busy += elapsed
+            # One stage per worker, so metrics.json/.prom show each session's count, busy time and latency
+            METRICS.observe(f"checker_worker_{worker.index}", elapsed)
+            self.done.put((url, result, elapsed))
+
+    def submit(self, url):
+        """
+        Queue a URL for the next free worker; blocks while every worker has a backlog.
+        """
+        with self.lock:
+            self.in_flight += 1
+        self.tasks.put(url)
+
+    def completed(self, wait=False):
+        """
+        Yield (url, result, elapsed) for finished checks. wait=False only yields what is
+        already done; wait=True blocks until nothing submitted is left in flight.
+        """
+        while True:
+            with self.lock:
+                if not self.in_flight:
+                    return
+            try:
+                item = self.done.get(timeout=0.2) if wait else self.done.get_nowait()
+            except queue.Empty:
+                if wait:
+                    continue
+                return
+            with self.lock:
+                self.in_flight -= 1
+            yield item
+
+    def check_many(self, urls):
+        """
+        Feed URLs (consumed lazily, so a budgeted generator can stop early) to the
+        workers and yield (url, result, elapsed) in completion order.
+        """
+        for url in urls:
+            self.submit(url)
+            yield from self.completed()
+        yield from self.completed(wait=True)
+
+    def check(self, url):
+        for _, result, _ in self.check_many([url]):
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+    def restart(self):
+        # Workers replace their own crashed sessions
+        pass
+
+    def stats(self):
+        """
+        Per-worker throughput: checks, busy seconds, checks per minute and restarts.
+        """
+        now = time.monotonic()
+        rows = []
+        for worker in self.workers:
+            wall = now - worker.started if worker.started else 0.0
+            rows.append({
+                "worker": worker.index,
+                "checks": worker.checks,
+                "busy_seconds": worker.busy,
+                "checks_per_minute": worker.checks / wall * 60 if wall else 0.0,
+                "restarts": worker.restarts,
+            })
+        return rows
+
+    def close(self):
+        for _ in self.threads:
+            self.tasks.put(_STOP)
+        for thread in self.threads:
+            thread.join()
+        for row in self.stats() if self.threads else []:
+            print(f"[INFO] Checker worker {row['worker']}: {row['checks']} checks, "
+                  f"{row['checks_per_minute']:.1f}/min, {row['busy_seconds']:.1f}s busy, {row['restarts']} restarts")
+        for worker in self.workers:
+            try:
+                worker.checker.close()
+            except Exception:
+                pass
@@ -0,0 +1,141 @@
+# fake_linkedin_server.py
+"""
+Offline stand-in for LinkedIn profile pages, used to load-test the checker backends.
+
+    python fake_linkedin_server.py --port 8765 --latency 0.8 --not-found 0.1 --redirect 0.1 --errors 0.05
+    python Main.py <folder> --backend http --base-url http://127.0.0.1:8765
+"""
+import time
+import zlib
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+PROFILE_PAGE = """<html>
+<head><meta charset="UTF-8"><title>{name} | LinkedIn</title></head>
+<body>
+<main>
+<h1 class="inline t-24 v-align-middle break-words">{name}</h1>
+<p>{filler}</p>
+</main>
+</body>
+</html>"""
+
+NOT_FOUND_PAGE = "<html><body><main><h2>This page doesn't exist</h2></main></body></html>"
+
+
+class FakeLinkedInConfig:
+    """
+    Behaviour of the stand-in server. Outcomes are derived from a hash of the slug,
+    so a given profile always gets the same answer across runs.
+    Slugs starting with "missing-" always 404 and "moved-" always redirect.
+    `errors` is the share of requests (random each time, unlike the outcomes)
+    answered with a transient 503, to exercise the retry queue.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, not_found=0.0, redirect=0.0, page_size=20000, errors=0.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.not_found = not_found
+        self.redirect = redirect
+        self.page_size = page_size
+        self.errors = errors
+
+    def outcome(self, slug):
+        if slug.startswith("missing-"):
+            return "not_found"
+        if slug.startswith("moved-"):
+            return "redirect"
+        bucket = (zlib.crc32(slug.encode("utf-8")) % 10000) / 10000
+        if bucket < self.not_found:
+            return "not_found"
+        if bucket < self.not_found + self.redirect:
+            return "redirect"
+        return "ok"
+
+    def delay(self):
+        return max(0.0, self.latency + random.uniform(-self.jitter, self.jitter))
+
+
+class FakeLinkedInHandler(BaseHTTPRequestHandler):
+    config = FakeLinkedInConfig()
+
+    def do_GET(self):
+        time.sleep(self.config.delay())
+        path = urlsplit(self.path).path
+        segments = [s for s in path.split("/") if s]
+
+        if len(segments) < 2 or segments[0] != "in":
+            self._send(404, NOT_FOUND_PAGE)
+            return
+
+        if random.random() < self.config.errors:
+            self._send(503, "<html><body>Service unavailable</body></html>")
+            return
+
+        slug = segments[1]
+        outcome = self.config.outcome(slug)
+        if outcome == "not_found":
+            self._send(404, NOT_FOUND_PAGE)
+        elif outcome == "redirect":
+            self.send_response(302)
+            self.send_header("Location", "/feed/")
+            self.end_headers()
+        else:
+            name = slug.replace("-", " ").title()
+            filler = "Lorem ipsum dolor sit amet. " * (self.config.page_size // 28)
+            self._send(200, PROFILE_PAGE.format(name=name, filler=filler))
+
+    def _send(self, code, body):
+        payload = body.encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(host="127.0.0.1", port=0, config=None):
+    handler = type("ConfiguredHandler", (FakeLinkedInHandler,), {"config": config or FakeLinkedInConfig()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_server(host="127.0.0.1", port=0, config=None):
+    """
+    Start the stand-in server on a background thread.
+    Returns (server, base_url); call server.shutdown() to stop it.
+    """
+    server = make_server(host, port, config)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve fake LinkedIn profile pages for offline load tests.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.5, help="Seconds to wait before answering")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Random +/- seconds added to the latency")
+    parser.add_argument("--not-found", type=float, default=0.1, help="Share of profiles answering 404")
+    parser.add_argument("--redirect", type=float, default=0.1, help="Share of profiles redirecting away from /in/")
+    parser.add_argument("--errors", type=float, default=0.0, help="Share of requests failing with a transient 503")
+    args = parser.parse_args()
+
+    config = FakeLinkedInConfig(args.latency, args.jitter, args.not_found, args.redirect, errors=args.errors)
+    server = make_server(args.host, args.port, config)
+    print(f"[INFO] Fake LinkedIn serving on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,86 +1,428 @@
 # file_reader.py
 import os
 import re
-from docx import Document
+import fnmatch
+import itertools
+import queue
+import time
+import threading
+import zipfile
+import multiprocessing
+from collections import namedtuple
+import xml.etree.ElementTree as ET
+from utils import file_digest, shard_of, extract_phones
+from metrics import METRICS
 
-def get_all_docx_files(folder_path):
+# WordprocessingML namespaces
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC_NS = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+DOCUMENT_XML = "word/document.xml"
+DOCUMENT_RELS = "word/_rels/document.xml.rels"
+
+# Bumped whenever a change to the extraction rules makes stored (phone, links) results stale
+EXTRACTOR_VERSION = 2
+
+# Contact data sits at the top of ATS resumes, so only the first lines are scanned
+CONTACT_PARAGRAPHS = 10
+
+LINKEDIN_PATTERN = re.compile(
+    r"(https?://[^\s]*linkedin\.com[^\s]*|www\.linkedin\.com[^\s]*|linkedin\.com[^\s]+)",
+    re.IGNORECASE
+)
+
+# Files handed to each pool worker at a time (their phones are extracted in one batch),
+# and parsed records buffered ahead of the checker
+EXTRACT_CHUNKSIZE = 8
+EXTRACT_QUEUE_SIZE = 256
+
+_DONE = object()
+
+# One parsed file as produced by the extraction stage
+ContactRecord = namedtuple("ContactRecord", ["file_path", "phone", "links", "digest", "parse_seconds"])
+
+
+def load_exclusions(exclusion_file):
+    """
+    Read exclusion patterns from EX.txt: one file or folder name per line.
+    Glob wildcards (*, ?, [..]) are allowed; blank lines and # comments are ignored.
+    """
+    if not os.path.exists(exclusion_file):
+        return []
+    with open(exclusion_file, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
+
+
+def is_excluded_name(name, exclude_patterns):
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in exclude_patterns)
+
+
+def iter_docx_files(folder_path, exclude_patterns=()):
+    """
+    Lazily yield the DOCX files under folder_path, walking with os.scandir.
+    Folders matching an exclusion pattern are pruned without being entered,
+    and excluded names, Word lock files (~$...) and empty files are skipped.
+    """
+    pending = [folder_path]
+    while pending:
+        directory = pending.pop()
+        started = time.perf_counter()
+        try:
+            with os.scandir(directory) as entries:
+                entries = list(entries)
+        except OSError as e:
+            print(f"Error reading folder {directory}: {e}")
+            continue
+        METRICS.observe("directory_walk", time.perf_counter() - started)
+
+        subdirectories = []
+        for entry in entries:
+            name = entry.name
+            if is_excluded_name(name, exclude_patterns):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+                elif (name.lower().endswith(".docx") and not name.startswith("~$")
+                      and entry.is_file() and entry.stat().st_size > 0):
+                    yield entry.path
+            except OSError:
+                continue
+
+        # Depth-first, visiting subfolders in listing order
+        pending.extend(reversed(subdirectories))
+
+
+def iter_shard(files, folder_path, shard):
+    """
+    Keep the files of shard (i, n): each file belongs to exactly one shard, chosen by
+    a stable hash of its path relative to folder_path.
+    """
+    index, count = shard
+    for file_path in files:
+        if shard_of(os.path.relpath(file_path, folder_path), count) == index:
+            yield file_path
+
+
+def get_all_docx_files(folder_path, exclude_patterns=()):
     """
     Return a list of all DOCX files in the folder including subfolders.
     """
-    docx_files = []
-    for root, _, files in os.walk(folder_path):
-        for file in files:
-            if file.lower().endswith(".docx"):
-                docx_files.append(os.path.join(root, file))
-    return docx_files
+    return list(iter_docx_files(folder_path, exclude_patterns))
 
-def extract_linkedin_links(file_path):
+
+def _read_hyperlink_targets(docx_zip):
     """
-    Extract all LinkedIn links from DOCX file (text + hyperlinks).
-    Handles links without http/https and split runs.
+    Return the LinkedIn hyperlink targets declared in the document relationships.
+    """
+    targets = []
+    try:
+        rels_xml = docx_zip.read(DOCUMENT_RELS)
+    except KeyError:
+        return targets
+
+    for rel in ET.fromstring(rels_xml).iter(f"{REL_NS}Relationship"):
+        rel_type = rel.get("Type", "").lower()
+        target = rel.get("Target", "").strip()
+        if "hyperlink" in rel_type and "linkedin.com" in target.lower():
+            targets.append(target)
+    return targets
+
+
+def _iter_paragraph_texts(stream):
+    """
+    Stream-parse document.xml and yield the text of each top-level body paragraph.
+    Nothing beyond the last consumed paragraph is read from the archive.
+    """
+    depth = 0
+    paragraph_depth = None
+    fallback_depth = None
+    parts = []
+
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            # document > body > p
+            if elem.tag == f"{W_NS}p" and depth == 3:
+                paragraph_depth = depth
+                parts = []
+            elif elem.tag == f"{MC_NS}Fallback" and fallback_depth is None:
+                fallback_depth = depth
+            continue
+
+        if paragraph_depth is not None and fallback_depth is None:
+            if elem.tag == f"{W_NS}t":
+                parts.append(elem.text or "")
+            elif elem.tag == f"{W_NS}tab":
+                parts.append("\t")
+            elif elem.tag in (f"{W_NS}br", f"{W_NS}cr"):
+                parts.append("\n")
+
+        if depth == fallback_depth:
+            fallback_depth = None
+        if depth == paragraph_depth:
+            paragraph_depth = None
+            elem.clear()
+            yield "".join(parts)
+        depth -= 1
+
+
+def read_contact_lines(file_path, max_paragraphs=CONTACT_PARAGRAPHS):
+    """
+    Read the phone candidate lines and the LinkedIn links of a DOCX file in a single pass.
+    The archive is opened once and only the first `max_paragraphs` non-empty
+    paragraphs are parsed (None scans the whole document); hyperlink targets
+    come from the relationships part. Returns (lines, links), lines being the
+    first CONTACT_PARAGRAPHS non-empty paragraphs for utils.extract_phones.
     """
     links = set()
+    lines = []
     try:
-        doc = Document(file_path)
-
-        # Process paragraphs
-        pattern = re.compile(
-            r"(https?://[^\s]*linkedin\.com[^\s]*|www\.linkedin\.com[^\s]*|linkedin\.com[^\s]+)",
-            re.IGNORECASE
-        )
-
-        for para in doc.paragraphs:
-            text = "".join(run.text for run in para.runs).replace("\n", " ").strip()
-            for match in pattern.findall(text):
-                clean_link = match.strip()
-                if not clean_link.startswith("http"):
-                    clean_link = "https://" + clean_link
-                links.add(clean_link)
-
-        # Process hyperlinks
-        for rel in doc.part.rels.values():
-            if "hyperlink" in rel.reltype.lower() and "linkedin.com" in rel.target_ref.lower():
-                links.add(rel.target_ref.strip())
+        with zipfile.ZipFile(file_path) as docx_zip:
+            links.update(_read_hyperlink_targets(docx_zip))
+
+            with docx_zip.open(DOCUMENT_XML) as stream:
+                for text in _iter_paragraph_texts(stream):
+                    text = text.strip()
+                    if not text:
+                        continue
+                    lines.append(text)
+
+                    for match in LINKEDIN_PATTERN.findall(text.replace("\n", " ")):
+                        clean_link = match.strip()
+                        if not clean_link.startswith("http"):
+                            clean_link = "https://" + clean_link
+                        links.add(clean_link)
+
+                    if max_paragraphs is not None and len(lines) >= max_paragraphs:
+                        break
 
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
 
-    return list(links)
+    return lines[:CONTACT_PARAGRAPHS], list(links)
+
+
+def extract_contact_info(file_path, max_paragraphs=CONTACT_PARAGRAPHS):
+    """
+    Extract the normalized phone number and LinkedIn links of a DOCX file.
+    Returns (phone, links).
+    """
+    lines, links = read_contact_lines(file_path, max_paragraphs)
+    return extract_phones([lines])[0], links
+
+
+def extract_linkedin_links(file_path):
+    """
+    Extract all LinkedIn links from DOCX file (text + hyperlinks).
+    Handles links without http/https and split runs.
+    """
+    return read_contact_lines(file_path, max_paragraphs=None)[1]
 
-    
 
 def extract_phone_number(file_path):
     """
     Extract one valid phone number from the first 10 non-empty lines (including runs) of a DOCX file.
     If not found, return "N/A".
     """
-    phone_pattern = re.compile(
-        r"(\+?\d{1,4}[\s-]?\(?\d+\)?[\s-]?\d+[\s-]?\d+)"
-    )
-    try:
-        doc = Document(file_path)
+    return extract_contact_info(file_path)[0]
 
-        first_lines = []
-        for para in doc.paragraphs:
-            # ناخد النص من الـ runs كمان
-            full_text = "".join(run.text for run in para.runs).strip()
-            if not full_text:
-                continue
-            first_lines.append(full_text)
-            if len(first_lines) >= 10:
-                break
 
-        text_block = "\n".join(first_lines)
-        matches = phone_pattern.findall(text_block)
+def _extract_records(tasks):
+    """
+    Parse a chunk of (file_path, digest) tasks and extract all their phones in one batch.
+    """
+    parsed = []
+    for file_path, digest in tasks:
+        started = time.perf_counter()
+        lines, links = read_contact_lines(file_path)
+        if digest is None:
+            try:
+                digest = file_digest(file_path)
+            except OSError:
+                digest = None
+        parsed.append((file_path, lines, links, digest, time.perf_counter() - started))
+
+    started = time.perf_counter()
+    phones = extract_phones([lines for _, lines, _, _, _ in parsed])
+    # The batch is charged evenly to the files it served
+    share = (time.perf_counter() - started) / max(len(parsed), 1)
+    return [ContactRecord(file_path, phone, links, digest, parse_seconds + share)
+            for (file_path, _, links, digest, parse_seconds), phone in zip(parsed, phones)]
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
 
-        clean_numbers = [m for m in matches if len(re.sub(r"\D", "", m)) >= 7]
+class _DuplicateIndex:
+    """
+    Spots byte-identical copies of a DOCX within one run so each distinct document is
+    parsed once. Files are only hashed when another file of the same size was seen;
+    the first file of each size is hashed by the worker that parses it, and files of
+    its size are compared once that digest is known. A copy gets the (phone, links)
+    of the first file with the same content, as soon as that one is parsed.
+    Shared by the pool's task feeder and the result loop.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sizes = {}  # size -> first file of that size
+        self.originals = {}  # digest -> file parsed for that content
+        self.parsed = {}  # parsed file -> (phone, links)
+        self.waiting = {}  # file being parsed -> [(file, digest)] to compare with it once parsed
+
+    def route(self, file_path):
+        """
+        Sort a file before parsing. Return (parse, digest, copy): parse is True if the file
+        must be parsed itself, digest its hash if already known, and copy the record of a
+        copy whose original is parsed (None while it waits for resolve()).
+        """
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            return True, None, None
+        with self.lock:
+            first = self.sizes.setdefault(size, file_path)
+        if first == file_path:
+            return True, None, None
+
+        try:
+            digest = file_digest(file_path)
+        except OSError:
+            return True, None, None
+        with self.lock:
+            if first not in self.parsed:
+                # The first file of this size is still being parsed and hashed
+                self.waiting.setdefault(first, []).append((file_path, digest))
+                return False, digest, None
+            original = self.originals.setdefault(digest, file_path)
+            if original == file_path:
+                return True, digest, None
+            parsed = self.parsed.get(original)
+            if parsed is None:
+                self.waiting.setdefault(original, []).append((file_path, digest))
+                return False, digest, None
+        return False, digest, self._copy(parsed, file_path, digest)
+
+    def resolve(self, record):
+        """
+        Remember a parsed file. Return (copies, unmatched): the records of the copies that
+        were waiting for it, and the (file_path, digest) of waiting files whose content
+        turned out to differ, which still need parsing.
+        """
+        copies, unmatched = [], []
+        with self.lock:
+            self.parsed[record.file_path] = (record.phone, record.links)
+            if record.digest is not None:
+                self.originals.setdefault(record.digest, record.file_path)
+            for file_path, digest in self.waiting.pop(record.file_path, []):
+                original = self.originals.setdefault(digest, file_path)
+                if original == file_path:
+                    unmatched.append((file_path, digest))
+                elif original in self.parsed:
+                    copies.append(self._copy(self.parsed[original], file_path, digest))
+                else:
+                    self.waiting.setdefault(original, []).append((file_path, digest))
+        return copies, unmatched
+
+    def _copy(self, parsed, file_path, digest):
+        METRICS.incr("duplicate_files")
+        phone, links = parsed
+        return ContactRecord(file_path, phone, list(links), digest, None)
+
+
+def _pending_files(files, records, lookup, duplicates):
+    """
+    Yield (file_path, digest) for the files that need parsing; files the lookup already
+    knows, and copies of a document parsed in this run, go straight to the queue.
+    """
+    for file_path in files:
+        cached = lookup(file_path) if lookup else None
+        if cached is not None:
+            phone, links = cached
+            records.put(ContactRecord(file_path, phone, links, None, None))
+            continue
 
-        if clean_numbers:
-            return clean_numbers[0]
+        parse, digest, copy = duplicates.route(file_path) if duplicates else (True, None, None)
+        if parse:
+            yield file_path, digest
+        elif copy is not None:
+            records.put(copy)
+
+
+def _run_extraction(files, pool, records, lookup, duplicates):
+    """
+    Producer thread: parse the files with `pool` (None parses in this thread). The pool
+    was created by the caller; this thread only feeds it, then closes it.
+    """
+    def emit(record):
+        records.put(record)
+        if duplicates:
+            copies, unmatched = duplicates.resolve(record)
+            for copy in copies:
+                records.put(copy)
+            # Same size as a parsed file but other content: rare enough to parse right here
+            for other in _extract_records(unmatched) if unmatched else []:
+                emit(other)
+
+    try:
+        chunks = _chunks(_pending_files(files, records, lookup, duplicates), EXTRACT_CHUNKSIZE)
+        if pool is None:
+            for chunk in chunks:
+                for record in _extract_records(chunk):
+                    emit(record)
         else:
-            return "N/A"
+            for parsed in pool.imap_unordered(_extract_records, chunks):
+                for record in parsed:
+                    emit(record)
     except Exception as e:
-        print(f"Error extracting phone from {file_path}: {e}")
+        records.put(e)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+    records.put(_DONE)
+
+
+def stream_contact_info(files, workers=None, lookup=None, dedupe=True):
+    """
+    Parse DOCX files across a process pool and yield ContactRecord tuples as they
+    complete; digest is the content hash used by the scan manifest.
+    Extraction starts immediately in a background thread feeding a bounded queue,
+    so it overlaps with whatever the caller does next (e.g. browser startup and login).
+    `files` may be a lazy iterator, so parsing starts while the walk is still running.
+    `lookup(file_path)` may return a known (phone, links) to skip parsing that file;
+    it runs on the background thread.
+    dedupe=True parses byte-identical copies once and yields a record for every copy.
+    workers=None uses every core; workers=1 parses in the background thread only.
+    """
+    workers = workers or os.cpu_count() or 1
+    if isinstance(files, list):
+        workers = max(1, min(workers, len(files)))
+    records = queue.Queue(maxsize=EXTRACT_QUEUE_SIZE)
+    duplicates = _DuplicateIndex() if dedupe else None
+    # Worker processes are started from the calling thread; the producer thread only feeds them
+    pool = multiprocessing.Pool(processes=workers) if workers > 1 else None
+    producer = threading.Thread(target=_run_extraction, args=(files, pool, records, lookup, duplicates),
+                                daemon=True)
+    producer.start()
+    return _drain_records(records, producer)
+
 
-    return "N/A"
+def _drain_records(records, producer):
+    while True:
+        record = records.get()
+        if record is _DONE:
+            break
+        if isinstance(record, Exception):
+            raise record
+        yield record
 
+    producer.join()
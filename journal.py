@@ -0,0 +1,91 @@
+# journal.py
+import os
+import json
+
+JOURNAL_FILE = "journal.jsonl"
+# Watch mode keeps its own journal so a daemon never truncates the batch run's checkpoint
+WATCH_JOURNAL_FILE = "watch_journal.jsonl"
+
+# Results are fsynced in batches; a crash loses at most this many rows
+SYNC_EVERY = 10
+
+
+class ResultJournal:
+    """
+    Append-only JSONL checkpoint of process_files results.
+    Each result is written as soon as it is produced, so an interrupted run
+    can be resumed and its reports rebuilt from what was already checked.
+    """
+
+    def __init__(self, path, resume=False):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.replayed = read_journal(path) if resume else []
+        self.file = open(path, "a" if resume else "w", encoding="utf-8")
+        if resume and self.file.tell() > 0 and not _ends_with_newline(path):
+            self.file.write("\n")
+        self.unsynced = 0
+        self.lines = len(self.replayed)
+
+    def completed(self):
+        """
+        Return the (full_path, link) pairs already recorded by the replayed journal.
+        """
+        return {(r["full_path"], r["link"]) for r in self.replayed}
+
+    def append(self, result):
+        self.file.write(json.dumps(result, ensure_ascii=False) + "\n")
+        self.file.flush()
+        self.lines += 1
+        self.unsynced += 1
+        if self.unsynced >= SYNC_EVERY:
+            os.fsync(self.file.fileno())
+            self.unsynced = 0
+
+    def compact(self, results):
+        """
+        Atomically rewrite the journal with only `results` (dicts), dropping rows that were
+        replaced since; appending then continues on the new file.
+        """
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for result in results:
+                f.write(json.dumps(result, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.file.close()
+        os.replace(temp_path, self.path)
+        self.file = open(self.path, "a", encoding="utf-8")
+        self.lines = len(results)
+        self.unsynced = 0
+
+    def close(self):
+        if not self.file.closed:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
+
+
+def read_journal(path):
+    """
+    Load the results recorded in a journal. A truncated last line (crash mid-write) is ignored.
+    """
+    results = []
+    if not os.path.exists(path):
+        return results
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                results.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return results
+
+
+def _ends_with_newline(path):
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
@@ -1,20 +1,48 @@
+import os
+import json
 import time
 import random
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
+from metrics import METRICS
+from utils import is_profile_url
+from check_errors import ProfileCheckError, classify_redirect, is_login_wall, TIMEOUT, DRIVER_ERROR
 
-def init_driver(headless=False):
+FEED_URL = "https://www.linkedin.com/feed/"
+SEARCH_BAR_SELECTOR = "input.search-global-typeahead__input"
+
+PROFILE_NAME_XPATH = "//h1[contains(@class,'inline t-24 v-align-middle break-words')]"
+
+# Resources fast verify mode never downloads: images, fonts and media
+BLOCKED_RESOURCE_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.m4a",
+    "*media.licdn.com*", "*static.licdn.com/aero-v1/sc/h/*font*",
+]
+
+class LoginError(Exception):
+    """Raised when LinkedIn login does not reach the signed-in home page."""
+
+
+def init_driver(headless=False, fast=False, user_data_dir=None):
     """
     Initialize undetected Chrome with anti-detection options.
     headless=False => browser is visible
+    fast=True => eager page loads with images, fonts and media blocked (see check_linkedin_profile_fast)
+    user_data_dir => persistent Chrome profile, so the LinkedIn session survives between runs
     """
     options = uc.ChromeOptions()
     if headless:
         options.add_argument("--headless=new")
+    if fast:
+        options.page_load_strategy = "eager"
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--autoplay-policy=user-gesture-required")
 
     # Anti-detection / privacy options
     options.add_argument("--disable-blink-features=AutomationControlled")
@@ -53,7 +81,12 @@ def init_driver(headless=False):
     options.add_argument("--disable-web-security")
     options.add_argument("--log-level=3")
 
-    driver = uc.Chrome(options=options, version_main=139)
+    if user_data_dir:
+        os.makedirs(user_data_dir, exist_ok=True)
+    driver = uc.Chrome(options=options, version_main=139, user_data_dir=user_data_dir)
+    if fast:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_PATTERNS})
     return driver
 
 
@@ -71,13 +104,79 @@ def login_linkedin(driver, username, password):
 
     try:
         WebDriverWait(driver, 60).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "input.search-global-typeahead__input"))
+            EC.presence_of_element_located((By.CSS_SELECTOR, SEARCH_BAR_SELECTOR))
         )
         print("[INFO] Login successful.")
     except TimeoutException:
         print("[ERROR] Could not find the search bar. Check login credentials.")
-        driver.quit()
-        exit(1)
+        raise LoginError("LinkedIn login failed")
+
+
+def _session_state(driver):
+    """
+    Wait condition for is_logged_in: "in" once the search bar renders, "out" on a login wall.
+    """
+    if is_login_wall(driver.current_url):
+        return "out"
+    if driver.find_elements(By.CSS_SELECTOR, SEARCH_BAR_SELECTOR):
+        return "in"
+    return False
+
+
+def is_logged_in(driver, timeout=15):
+    """
+    Open the feed and report whether the current browser session is still signed in.
+    """
+    driver.get(FEED_URL)
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.2).until(_session_state) == "in"
+    except TimeoutException:
+        return False
+
+
+def save_cookies(driver, cookie_file):
+    """
+    Write the browser's LinkedIn cookies to a JSON cookie jar.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(cookie_file)), exist_ok=True)
+    with open(cookie_file, "w", encoding="utf-8") as f:
+        json.dump(driver.get_cookies(), f)
+
+
+def load_cookies(driver, cookie_file):
+    """
+    Load a JSON cookie jar into the browser. Returns False if there is none.
+    """
+    if not os.path.exists(cookie_file):
+        return False
+    with open(cookie_file, "r", encoding="utf-8") as f:
+        cookies = json.load(f)
+
+    # Cookies can only be set for the domain currently loaded
+    driver.get("https://www.linkedin.com/")
+    for cookie in cookies:
+        cookie.pop("sameSite", None)
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            pass
+    return True
+
+
+def ensure_logged_in(driver, username, password, cookie_file=None):
+    """
+    Reuse an existing session (persistent profile and/or cookie jar) when it is
+    still valid, and only go through login_linkedin when it is not.
+    """
+    if cookie_file:
+        load_cookies(driver, cookie_file)
+    if is_logged_in(driver):
+        print("[INFO] Reusing saved LinkedIn session.")
+        return
+
+    login_linkedin(driver, username, password)
+    if cookie_file:
+        save_cookies(driver, cookie_file)
 
 
 def human_scroll(driver):
@@ -100,22 +199,29 @@ def human_scroll(driver):
 
 
 def check_linkedin_profile(driver, url):
+    """
+    Open a profile like a person would and return (True, name).
+    Raises ProfileCheckError classifying why the profile could not be verified.
+    """
     try:
-        driver.get(url)
+        with METRICS.time("page_navigation"):
+            driver.get(url)
         time.sleep(random.uniform(1, 2))
 
-        if "linkedin.com/in/" not in driver.current_url.lower():
-            return False, ""
+        if not is_profile_url(driver.current_url):
+            raise ProfileCheckError(classify_redirect(driver.current_url))
 
         driver.find_element(By.TAG_NAME, "main")
-        human_scroll(driver)
+        with METRICS.time("scroll"):
+            human_scroll(driver)
 
         try:
-            name_element = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//h1[contains(@class,'inline t-24 v-align-middle break-words')]")
+            with METRICS.time("name_wait"):
+                name_element = WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located(
+                        (By.XPATH, PROFILE_NAME_XPATH)
+                    )
                 )
-            )
             name = name_element.text.strip()
         except TimeoutException:
             name = ""
@@ -125,5 +231,55 @@ def check_linkedin_profile(driver, url):
         time.sleep(random.uniform(0.5, 1.5))
         return True, name
 
-    except (NoSuchElementException, TimeoutException):
-        return False, ""
+    except (NoSuchElementException, TimeoutException, WebDriverException) as e:
+        raise _classify_driver_exception(e) from e
+
+
+def _classify_driver_exception(error):
+    # A page that never rendered is worth retrying; anything else means the session itself failed
+    if isinstance(error, NoSuchElementException):
+        return ProfileCheckError(TIMEOUT, "profile page did not render")
+    if isinstance(error, TimeoutException):
+        return ProfileCheckError(TIMEOUT, "page load timed out")
+    return ProfileCheckError(DRIVER_ERROR, error.msg or type(error).__name__)
+
+
+def _profile_resolved(driver):
+    """
+    Wait condition for fast verify: a non-profile URL or a non-empty name ends the wait.
+    """
+    if not is_profile_url(driver.current_url):
+        return "redirected"
+    for element in driver.find_elements(By.XPATH, PROFILE_NAME_XPATH):
+        name = element.text.strip()
+        if name:
+            return name
+    return False
+
+
+def check_linkedin_profile_fast(driver, url, timeout=10):
+    """
+    Fast verify: same result as check_linkedin_profile, but without fixed sleeps or scrolling.
+    Returns as soon as LinkedIn redirects away from /in/ or the profile name renders.
+    Meant for a driver started with init_driver(fast=True).
+    """
+    try:
+        with METRICS.time("page_navigation"):
+            driver.get(url)
+        try:
+            with METRICS.time("name_wait"):
+                resolved = WebDriverWait(driver, timeout, poll_frequency=0.1).until(_profile_resolved)
+        except TimeoutException:
+            # Still on the profile but no name: valid as long as the page rendered
+            if not is_profile_url(driver.current_url):
+                raise ProfileCheckError(classify_redirect(driver.current_url))
+            driver.find_element(By.TAG_NAME, "main")
+            print("[WARNING] Could not find profile name.")
+            return True, ""
+
+        if resolved == "redirected":
+            raise ProfileCheckError(classify_redirect(driver.current_url))
+        return True, resolved
+
+    except (NoSuchElementException, TimeoutException, WebDriverException) as e:
+        raise _classify_driver_exception(e) from e
@@ -0,0 +1,128 @@
+# metrics.py
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+METRICS_JSON = "metrics.json"
+METRICS_PROM = "metrics.prom"
+PROM_PREFIX = "linkedin_checker"
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class Metrics:
+    """
+    Per-stage timers and counters for one run.
+    Stages collect every duration so p50/p95/max can be reported; counters named
+    "<cache>_hits" / "<cache>_misses" are also summarized as hit rates.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = {}
+        self.counters = {}
+        self.started = time.time()
+
+    def observe(self, stage, seconds):
+        with self.lock:
+            self.samples.setdefault(stage, []).append(seconds)
+
+    @contextmanager
+    def time(self, stage):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started)
+
+    def incr(self, counter, amount=1):
+        with self.lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def summary(self):
+        with self.lock:
+            samples = {stage: sorted(values) for stage, values in self.samples.items()}
+            counters = dict(self.counters)
+
+        stages = {}
+        for stage, values in samples.items():
+            stages[stage] = {
+                "count": len(values),
+                "total": sum(values),
+                "p50": _percentile(values, 0.50),
+                "p95": _percentile(values, 0.95),
+                "max": values[-1] if values else 0.0,
+            }
+
+        hit_rates = {}
+        for name, hits in counters.items():
+            if not name.endswith("_hits"):
+                continue
+            cache = name[:-len("_hits")]
+            lookups = hits + counters.get(f"{cache}_misses", 0)
+            hit_rates[cache] = hits / lookups if lookups else 0.0
+
+        return {
+            "started_at": datetime.fromtimestamp(self.started).isoformat(timespec="seconds"),
+            "wall_seconds": time.time() - self.started,
+            "stages": stages,
+            "counters": counters,
+            "hit_rates": hit_rates,
+        }
+
+    def export(self, output_folder):
+        """
+        Write the run summary as JSON and as a Prometheus textfile (node_exporter format).
+        Both files are replaced atomically. Returns the summary.
+        """
+        os.makedirs(output_folder, exist_ok=True)
+        summary = self.summary()
+        _write_atomic(os.path.join(output_folder, METRICS_JSON), json.dumps(summary, indent=2))
+        _write_atomic(os.path.join(output_folder, METRICS_PROM), _prometheus_text(summary))
+        return summary
+
+
+def _prometheus_text(summary):
+    lines = [
+        f"# HELP {PROM_PREFIX}_stage_seconds Duration of each pipeline stage.",
+        f"# TYPE {PROM_PREFIX}_stage_seconds summary",
+    ]
+    for stage, stats in sorted(summary["stages"].items()):
+        for quantile, key in (("0.5", "p50"), ("0.95", "p95"), ("1", "max")):
+            lines.append(f'{PROM_PREFIX}_stage_seconds{{stage="{stage}",quantile="{quantile}"}} {stats[key]:.6f}')
+        lines.append(f'{PROM_PREFIX}_stage_seconds_sum{{stage="{stage}"}} {stats["total"]:.6f}')
+        lines.append(f'{PROM_PREFIX}_stage_seconds_count{{stage="{stage}"}} {stats["count"]}')
+
+    lines.append(f"# HELP {PROM_PREFIX}_events_total Counted events of the last run.")
+    lines.append(f"# TYPE {PROM_PREFIX}_events_total counter")
+    for name, value in sorted(summary["counters"].items()):
+        lines.append(f'{PROM_PREFIX}_events_total{{event="{name}"}} {value}')
+
+    lines.append(f"# HELP {PROM_PREFIX}_cache_hit_ratio Cache hit ratio of the last run.")
+    lines.append(f"# TYPE {PROM_PREFIX}_cache_hit_ratio gauge")
+    for cache, ratio in sorted(summary["hit_rates"].items()):
+        lines.append(f'{PROM_PREFIX}_cache_hit_ratio{{cache="{cache}"}} {ratio:.6f}')
+
+    lines.append(f"# HELP {PROM_PREFIX}_run_seconds Wall-clock duration of the last run.")
+    lines.append(f"# TYPE {PROM_PREFIX}_run_seconds gauge")
+    lines.append(f"{PROM_PREFIX}_run_seconds {summary['wall_seconds']:.3f}")
+    return "\n".join(lines) + "\n"
+
+
+def _write_atomic(path, content):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+# Process-wide registry used by every stage of a run
+METRICS = Metrics()
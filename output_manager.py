@@ -1,205 +1,384 @@
 import os
-import pandas as pd
+import json
+import time
+import threading
 from datetime import datetime
-from openpyxl import load_workbook
-from openpyxl.styles import Alignment, PatternFill, Border, Side, Font
-from openpyxl.utils import get_column_letter
 
 
 def display_results_terminal(results):
     print("=" * 60)
     for res in results:
-        status_icon = "✔" if res["status"] else "✖"
-        print(f"📄 File: {res['file_name']}")
+        status_icon = "✔" if res.status else "✖"
+        print(f"📄 File: {res.file_name}")
         print("=" * 60)
-        print(f"📍 Path: {res['full_path']}")
-        print(f"📁 Folder: {res['folder_name']}")
-        print(f"📞 Phone: {res['phone']}")
-        print(f"🔗 Link: {res['link']}")
-        print(f"👤 Name: {res['name'] if res['name'] else 'N/A'}")
+        print(f"📍 Path: {res.full_path}")
+        print(f"📁 Folder: {res.folder_name}")
+        print(f"📞 Phone: {res.phone}")
+        print(f"🔗 Link: {res.link}")
+        print(f"👤 Name: {res.name if res.name else 'N/A'}")
         print(f"✅ Status: {status_icon}")
+        if res.reason:
+            print(f"⚠️ Reason: {res.reason}")
         print("-" * 60)
 
-def save_results_html(results, output_folder):
-    """Save results to a dark-themed HTML file with a status filter."""
-    os.makedirs(output_folder, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
-    output_path = os.path.join(output_folder, f"linkedin_results_{timestamp}.html")
-
-    html_content = """
-    <html>
-    <head>
-    <meta charset="UTF-8">
-    <title>LinkedIn Check Results</title>
-    <style>
-        body { background-color: #121212; color: white; font-family: Arial, sans-serif; }
-        table { border-collapse: collapse; width: 100%; margin-top: 20px; }
-        th, td { border: 1px solid #444; padding: 8px; text-align: left; }
-        th { background-color: #1f1f1f; }
-        tr:nth-child(even) { background-color: #1e1e1e; }
-        .status-true { color: #4CAF50; font-weight: bold; }
-        .status-false { color: #F44336; font-weight: bold; }
-        select { margin-top: 10px; padding: 5px; }
-        a { color: #4da3ff; text-decoration: none; }
-        a:hover { text-decoration: underline; }
-    </style>
-    <script>
-        function filterStatus() {
-            var filter = document.getElementById("statusFilter").value;
-            var rows = document.getElementById("resultsTable").rows;
-            for (var i = 1; i < rows.length; i++) {
-                var statusCell = rows[i].cells[6];
-                if (filter === "all") {
-                    rows[i].style.display = "";
-                } else if (filter === "valid" && statusCell.innerText === "✔") {
-                    rows[i].style.display = "";
-                } else if (filter === "invalid" && statusCell.innerText === "✖") {
-                    rows[i].style.display = "";
-                } else {
-                    rows[i].style.display = "none";
-                }
-            }
+HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="UTF-8">
+<title>LinkedIn Check Results</title>
+<style>
+    body { background-color: #121212; color: white; font-family: Arial, sans-serif; }
+    .controls { display: flex; gap: 16px; align-items: center; flex-wrap: wrap; margin-top: 10px; }
+    select, input { padding: 5px; background-color: #1f1f1f; color: white; border: 1px solid #444; }
+    input { width: 280px; }
+    #viewport { height: 75vh; overflow-y: auto; margin-top: 20px; border: 1px solid #444; }
+    table { border-collapse: collapse; width: 100%; table-layout: fixed; }
+    th, td { border: 1px solid #444; padding: 0 8px; text-align: left; height: 36px;
+             white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+    th { background-color: #1f1f1f; position: sticky; top: 0; z-index: 1; }
+    tr.even { background-color: #1e1e1e; }
+    .status-true { color: #4CAF50; font-weight: bold; }
+    .status-false { color: #F44336; font-weight: bold; }
+    a { color: #4da3ff; text-decoration: none; }
+    a:hover { text-decoration: underline; }
+</style>
+</head>
+<body>
+<h1>LinkedIn Check Results</h1>
+<div class="controls">
+    <label>Filter by status:
+        <select id="statusFilter">
+            <option value="all">All</option>
+            <option value="valid">✔ Valid</option>
+            <option value="invalid">✖ Invalid</option>
+        </select>
+    </label>
+    <label>Folder:
+        <select id="folderFilter"><option value="all">All</option></select>
+    </label>
+    <label>Search: <input id="search" type="search" placeholder="file, phone, link, name..."></label>
+    <span id="summary"></span>
+</div>
+<div id="viewport">
+<table>
+<colgroup>
+    <col style="width:13%"><col style="width:10%"><col style="width:21%"><col style="width:21%">
+    <col style="width:10%"><col style="width:13%"><col style="width:12%">
+</colgroup>
+<thead>
+<tr>
+    <th>File Name</th>
+    <th>Phone</th>
+    <th>Full Path</th>
+    <th>Link</th>
+    <th>Folder Name</th>
+    <th>Name</th>
+    <th>Status</th>
+</tr>
+</thead>
+<tbody id="rows"></tbody>
+</table>
+</div>
+<script>
+// Rows: [file_name, phone, full_path, link, folder index, name, status]
+const ROWS = ["""
+
+HTML_TAIL = """;
+const ROW_HEIGHT = 36;
+const OVERSCAN = 10;
+
+// Indexes built once: row numbers per status and per folder
+const byStatus = { valid: [], invalid: [] };
+const byFolder = FOLDERS.map(() => []);
+ROWS.forEach((r, i) => {
+    (r[6] ? byStatus.valid : byStatus.invalid).push(i);
+    byFolder[r[4]].push(i);
+});
+let haystack = null;
+let view = ROWS.map((_, i) => i);
+
+const viewport = document.getElementById("viewport");
+const tbody = document.getElementById("rows");
+
+function intersect(a, b) {
+    const keep = new Set(b);
+    return a.filter(i => keep.has(i));
+}
+
+function applyFilters() {
+    const status = document.getElementById("statusFilter").value;
+    const folder = document.getElementById("folderFilter").value;
+    const query = document.getElementById("search").value.trim().toLowerCase();
+
+    let rows = null;
+    if (status !== "all") rows = byStatus[status];
+    if (folder !== "all") rows = rows ? intersect(byFolder[+folder], rows) : byFolder[+folder];
+    if (rows === null) rows = ROWS.map((_, i) => i);
+
+    if (query) {
+        if (!haystack) {
+            haystack = ROWS.map(r => [r[0], r[1], r[2], r[3], FOLDERS[r[4]], r[5], r[7]].join("\\n").toLowerCase());
         }
-    </script>
-    </head>
-    <body>
-    <h1>LinkedIn Check Results</h1>
-    <label for="statusFilter">Filter by status: </label>
-    <select id="statusFilter" onchange="filterStatus()">
-        <option value="all">All</option>
-        <option value="valid">✔ Valid</option>
-        <option value="invalid">✖ Invalid</option>
-    </select>
-    <table id="resultsTable">
-    <tr>
-        <th>File Name</th>
-        <th>Phone</th>
-        <th>Full Path</th>
-        <th>Link</th>
-        <th>Folder Name</th>
-        <th>Name</th>
-        <th>Status</th>
-    </tr>
-    """
+        rows = rows.filter(i => haystack[i].includes(query));
+    }
+    view = rows;
+    viewport.scrollTop = 0;
+    render();
+}
 
-    for res in results:
-        status_icon = "✔" if res["status"] else "✖"
-        status_class = "status-true" if res["status"] else "status-false"
-        link_html = f'<a href="{res["link"]}" target="_blank">{res["link"]}</a>'
-        
-        # استخراج مجلد الملف من full_path
-        folder_path = os.path.dirname(res['full_path']).replace('\\', '/')
-        # الرابط يفتح المجلد فقط
-        folder_link = f'<a href="file:///{folder_path}" target="_blank">{res["full_path"]}</a>'
-        
-        html_content += f"""
-        <tr>
-            <td>{res['file_name']}</td>
-            <td>{res['phone']}</td>
-            <td>{folder_link}</td>
-            <td>{link_html}</td>
-            <td>{res['folder_name']}</td>
-            <td>{res['name'] if res['name'] else 'N/A'}</td>
-            <td class="{status_class}">{status_icon}</td>
-        </tr>
-        """
-
-
-    html_content += """
-    </table>
-    </body>
-    </html>
+function cell(tr, text, className) {
+    const td = document.createElement("td");
+    if (className) td.className = className;
+    if (text instanceof Node) td.appendChild(text); else td.textContent = text;
+    td.title = td.textContent;
+    tr.appendChild(td);
+}
+
+function link(href, text) {
+    const a = document.createElement("a");
+    a.href = href;
+    a.target = "_blank";
+    a.textContent = text;
+    return a;
+}
+
+function spacer(height) {
+    const tr = document.createElement("tr");
+    const td = document.createElement("td");
+    td.colSpan = 7;
+    td.style.height = height + "px";
+    td.style.padding = "0";
+    td.style.border = "none";
+    tr.appendChild(td);
+    return tr;
+}
+
+// Only the rows inside the viewport (plus a small overscan) exist in the DOM
+function render() {
+    const first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+    const count = Math.ceil(viewport.clientHeight / ROW_HEIGHT) + 2 * OVERSCAN;
+    const last = Math.min(view.length, first + count);
+
+    const fragment = document.createDocumentFragment();
+    fragment.appendChild(spacer(first * ROW_HEIGHT));
+    for (let n = first; n < last; n++) {
+        const r = ROWS[view[n]];
+        const tr = document.createElement("tr");
+        if (n % 2) tr.className = "even";
+        // The path link opens the file's folder only
+        const folderPath = r[2].replace(/\\\\/g, "/").replace(/\\/[^\\/]*$/, "");
+        cell(tr, r[0]);
+        cell(tr, r[1]);
+        cell(tr, link("file:///" + folderPath, r[2]));
+        cell(tr, r[3] ? link(r[3], r[3]) : "");
+        cell(tr, FOLDERS[r[4]]);
+        cell(tr, r[5] || "N/A");
+        cell(tr, r[6] ? "✔" : (r[7] ? "✖ " + r[7] : "✖"), r[6] ? "status-true" : "status-false");
+        fragment.appendChild(tr);
+    }
+    fragment.appendChild(spacer((view.length - last) * ROW_HEIGHT));
+    tbody.replaceChildren(fragment);
+
+    document.getElementById("summary").textContent =
+        view.length ? `Rows ${first + 1}-${last} of ${view.length} (${ROWS.length} total)` : "No matching rows";
+}
+
+const folderSelect = document.getElementById("folderFilter");
+FOLDERS.map((name, i) => [name, i])
+    .sort((a, b) => a[0].localeCompare(b[0]))
+    .forEach(([name, i]) => folderSelect.add(new Option(`${name} (${byFolder[i].length})`, i)));
+
+let searchTimer = null;
+document.getElementById("statusFilter").addEventListener("change", applyFilters);
+folderSelect.addEventListener("change", applyFilters);
+document.getElementById("search").addEventListener("input", () => {
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(applyFilters, 150);
+});
+let scheduled = false;
+viewport.addEventListener("scroll", () => {
+    if (scheduled) return;
+    scheduled = true;
+    requestAnimationFrame(() => { scheduled = false; render(); });
+});
+window.addEventListener("resize", render);
+render();
+</script>
+</body>
+</html>
+"""
+
+
+def _json_for_script(value):
+    # Keep "</script>" and friends inside string literals from closing the tag
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+
+
+def save_results_html(results, output_folder, output_name=None):
     """
+    Save results (ResultRecords, e.g. a ResultTable) to a dark-themed HTML file with status/folder filters and search.
+    The results are streamed to the file as a compact JSON payload and rendered
+    by a virtualized table, so only the visible rows ever exist in the DOM.
+    output_name replaces the timestamped file name (without extension).
+    """
+    os.makedirs(output_folder, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
+    output_name = output_name or f"linkedin_results_{timestamp}"
+    output_path = os.path.join(output_folder, f"{output_name}.html")
 
+    folders = {}
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+        f.write(HTML_HEAD)
+        for n, res in enumerate(results):
+            folder_index = folders.setdefault(res.folder_name, len(folders))
+            row = [res.file_name, res.phone, res.full_path, res.link, folder_index,
+                   res.name or "", 1 if res.status else 0, res.reason]
+            f.write(("," if n else "") + "\n" + _json_for_script(row))
+        f.write("\n];\nconst FOLDERS = ")
+        f.write(_json_for_script(list(folders)))
+        f.write(HTML_TAIL)
 
     print(f"[HTML] Results saved to {output_path}")
 
 
+EXCEL_HEADERS = ["File Name", "Phone", "Full Path", "Link", "Folder Name", "Name", "Result", "Reason"]
+EXCEL_WIDTHS = [30.00, 30.00, 50.00, 50.00, 35.00, 35.00, 10.00, 25.00]
 
 
-def save_results_excel(results, output_folder):
-    """Save results to an Excel file with formatting."""
-    os.makedirs(output_folder, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
-    output_path = os.path.join(output_folder, f"linkedin_results_{timestamp}.xlsx")
+def _excel_styles():
+    """
+    Named styles shared by every cell of the Excel report.
+    """
+    from openpyxl.styles import Alignment, PatternFill, Border, Side, Font, NamedStyle
+
+    thin = Side(border_style="thin", color="000000")
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    center = Alignment(horizontal='center', vertical='center')
+
+    return [
+        NamedStyle(name="report_header", font=Font(size=16, bold=True), border=border, alignment=center,
+                   fill=PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")),
+        NamedStyle(name="report_key", font=Font(size=16, bold=True), border=border, alignment=center),
+        NamedStyle(name="report_cell", font=Font(size=16, bold=False), border=border, alignment=center),
+        NamedStyle(name="report_link", font=Font(color="0000FF", underline="single", size=16),
+                   border=border, alignment=center),
+    ]
+
 
-    df = pd.DataFrame(results)
-    df["status"] = df["status"].apply(lambda x: "✔" if x else "✖")
-    df = df[["file_name", "phone", "full_path", "link", "folder_name", "name", "status"]]
-    df.columns = ["File Name", "Phone", "Full Path", "Link", "Folder Name", "Name", "Result"]
+def _excel_quote(value):
+    return str(value).replace('"', '""')
 
-    df.to_excel(output_path, index=False)
 
-    wb = load_workbook(output_path)
-    ws = wb.active
+def save_results_excel(results, output_folder, output_name=None):
+    """
+    Save results (ResultRecords, e.g. a ResultTable) to an Excel file with formatting.
+    Rows are streamed through openpyxl's write-only mode with shared named styles,
+    so memory stays flat however many results there are.
+    output_name replaces the timestamped file name (without extension).
+    """
+    # openpyxl is only imported when a workbook is actually written
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+
+    os.makedirs(output_folder, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
+    output_name = output_name or f"linkedin_results_{timestamp}"
+    output_path = os.path.join(output_folder, f"{output_name}.xlsx")
+
+    wb = Workbook(write_only=True)
+    for style in _excel_styles():
+        wb.add_named_style(style)
+    ws = wb.create_sheet()
 
     # Freeze first column (A) and first row (1)
     ws.freeze_panes = "B2"
+    ws.row_dimensions[1].height = 40
+    for col, width in enumerate(EXCEL_WIDTHS, start=1):
+        ws.column_dimensions[get_column_letter(col)].width = width
 
-    # Yellow fill for header row A1:G1
-    yellow_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-
-    # Define full border style (all sides)
-    thin_border = Border(
-        left=Side(border_style="thin", color="000000"),
-        right=Side(border_style="thin", color="000000"),
-        top=Side(border_style="thin", color="000000"),
-        bottom=Side(border_style="thin", color="000000")
-    )
-
-    # Font size 16 for all cells
-    font_16 = Font(size=16)
-
-    # Set the height of the first row to 40 (or double if already set)
-    ws.row_dimensions[1].height = ws.row_dimensions[1].height * 2 if ws.row_dimensions[1].height else 40
-
-    # Set column widths
-    ws.column_dimensions['A'].width = 30.00
-    ws.column_dimensions['B'].width = 30.00
-    ws.column_dimensions['C'].width = 50.00
-    ws.column_dimensions['D'].width = 50.00
-    ws.column_dimensions['E'].width = 35.00
-    ws.column_dimensions['F'].width = 35.00
-    ws.column_dimensions['G'].width = 10.00
-
-    # Apply yellow fill, font size 16, border, and center alignment to header row only
-    for col in range(1, 8):  # Columns A=1 to G=7
-        cell = ws.cell(row=1, column=col)
-        cell.fill = yellow_fill
-        cell.font = Font(size=16, bold=True)
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-
-    # For the rest of the cells (from row 2 down), apply font size 16, full border, and center alignment
-    for row in range(2, ws.max_row + 1):
-        for col in range(1, ws.max_column + 1):
-            cell = ws.cell(row=row, column=col)
-            if col == 1:
-                cell.font = Font(size=16, bold=True)
-            else:
-                cell.font = Font(size=16, bold=False)
-            cell.border = thin_border
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-
-        # Link column (3) = Full Path, URL to File Explorer
-        cell_fullpath = ws.cell(row=row, column=3)
-        full_path = cell_fullpath.value
-        if full_path and not str(full_path).startswith('=HYPERLINK'):
-            folder_path = os.path.dirname(full_path).replace('\\', '\\\\')
-            cell_fullpath.value = f'=HYPERLINK("file:///{folder_path}", "{full_path}")'
-            cell_fullpath.font = Font(color="0000FF", underline="single", size=16)
+    def styled(value, style):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        return cell
+
+    ws.append([styled(header, "report_header") for header in EXCEL_HEADERS])
 
-        # Link column (4) = LinkedIn URL
-        cell_link = ws.cell(row=row, column=4)
-        url = cell_link.value
-        if url and not str(url).startswith('=HYPERLINK'):
-            cell_link.value = f'=HYPERLINK("{url}", "{url}")'
-            cell_link.font = Font(color="0000FF", underline="single", size=16)
+    for res in results:
+        full_path = res.full_path
+        url = res.link
 
+        # Full Path opens the file's folder in File Explorer
+        if full_path:
+            folder_path = os.path.dirname(full_path).replace('\\', '\\\\')
+            path_cell = styled(f'=HYPERLINK("file:///{_excel_quote(folder_path)}", "{_excel_quote(full_path)}")',
+                               "report_link")
+        else:
+            path_cell = styled(full_path, "report_cell")
 
+        if url:
+            link_cell = styled(f'=HYPERLINK("{_excel_quote(url)}", "{_excel_quote(url)}")', "report_link")
+        else:
+            link_cell = styled(url, "report_cell")
 
+        ws.append([
+            styled(res.file_name, "report_key"),
+            styled(res.phone, "report_cell"),
+            path_cell,
+            link_cell,
+            styled(res.folder_name, "report_cell"),
+            styled(res.name, "report_cell"),
+            styled("✔" if res.status else "✖", "report_cell"),
+            styled(res.reason, "report_cell"),
+        ])
 
     wb.save(output_path)
-    print(f"[Excel] Results saved to {output_path}")
\ No newline at end of file
+    print(f"[Excel] Results saved to {output_path}")
+
+
+class ThrottledWriter:
+    """
+    Runs write(results) on a background thread, at most once every `interval` seconds and
+    always with the latest results given to update(); results replaced in the meantime are
+    never written. close() writes whatever is still waiting, then stops the thread.
+    """
+
+    def __init__(self, write, interval):
+        self.write = write
+        self.interval = interval
+        self.condition = threading.Condition()
+        self.latest = None
+        self.closed = False
+        self.written_at = None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def update(self, results):
+        with self.condition:
+            self.latest = results
+            self.condition.notify()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while self.latest is None and not self.closed:
+                    self.condition.wait()
+                if self.latest is None:
+                    return
+                if self.written_at is not None:
+                    due = self.written_at + self.interval
+                    while not self.closed and time.monotonic() < due:
+                        self.condition.wait(due - time.monotonic())
+                results, self.latest = self.latest, None
+            self.written_at = time.monotonic()
+            try:
+                self.write(results)
+            except Exception as e:
+                # e.g. the workbook is open in Excel; the next update tries again
+                print(f"[WARNING] Could not write the report: {e}")
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+        self.thread.join()
@@ -0,0 +1,359 @@
+# pipeline.py
+import os
+import time
+import logging
+from scan_manifest import ScanManifest, MANIFEST_FILE
+from profile_cache import ProfileCache, CACHE_FILE
+from journal import ResultJournal, JOURNAL_FILE
+from result_table import ResultTable
+from metrics import METRICS
+from utils import unique_linkedin_urls
+from scheduler import prioritize
+from check_errors import failure_kind, TRANSIENT_FAILURES, RESTART_FAILURES
+
+logger = logging.getLogger("LinkedInChecker")
+
+# Verifier._known() result for a link that still has to go to the checker
+_UNKNOWN = object()
+
+# End-of-run retries of transient failures, waiting RETRY_BACKOFF * 2**attempt seconds before each round
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 5.0
+
+
+class CheckerStartError(Exception):
+    """
+    The profile checker could not start (browser launch or login failed).
+    """
+
+
+class Verifier:
+    """
+    Turns parsed files into results: checks each file's links with the profile
+    checker and records everything in the scan manifest, the profile cache and
+    the result journal. Used by a batch run (process_files) and by watch mode.
+    """
+
+    def __init__(self, checker, status_dir, max_age=None, resume=False, full_scan=False,
+                 retries=RETRY_ATTEMPTS, retry_backoff=RETRY_BACKOFF, journal_file=JOURNAL_FILE):
+        self.checker = checker
+        self.max_age = max_age
+        self.full_scan = full_scan
+
+        # Unchanged files reuse what the manifest recorded on a previous run
+        self.manifest = ScanManifest(os.path.join(status_dir, MANIFEST_FILE))
+
+        # Profile checks younger than max_age seconds are reused instead of opening the browser
+        self.cache = None
+        if checker.live:
+            self.cache = ProfileCache(os.path.join(status_dir, CACHE_FILE))
+            if max_age is not None:
+                evicted = self.cache.evict_expired(max_age)
+                logger.info(f"Evicted {evicted} expired profile checks")
+
+        # Every result is checkpointed; resume replays it and skips finished (file, link) pairs
+        self.journal = ResultJournal(os.path.join(status_dir, journal_file), resume=resume)
+        self.results = ResultTable(self.journal.replayed)
+        self.completed = self.journal.completed()
+        if self.completed:
+            logger.info(f"Resuming: {len(self.completed)} results replayed from the journal")
+
+        self.checked = {}  # canonical URL -> (status, name, reason), so each profile is checked once per run
+        self.pending = {}  # canonical URL -> [(file_path, phone)] waiting for a retry
+        self.failures = {}  # canonical URL -> class of its last transient failure
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.checks = 0
+        self.submitted = 0  # checker calls started, retries included; what a Budget counts
+        self.check_time = 0.0
+        self.started = False
+
+    def start(self):
+        """
+        Start the checker (browser launch and login). Called on the first link that
+        actually needs checking, so a run with nothing new never opens a browser.
+        """
+        if self.started:
+            return
+        self.started = True
+        try:
+            with METRICS.time("checker_start"):
+                self.checker.start()
+        except Exception as e:
+            raise CheckerStartError(e) from e
+
+    def lookup(self, file_path):
+        """
+        Manifest lookup callback for stream_contact_info.
+        """
+        if self.full_scan:
+            return None
+        cached = self.manifest.lookup(file_path)
+        METRICS.incr("scan_manifest_hits" if cached is not None else "scan_manifest_misses")
+        return cached
+
+    def _store_record(self, record):
+        file_path, phone, links, digest, parse_seconds = record
+        METRICS.incr("files_processed")
+        if parse_seconds is not None:
+            METRICS.observe("docx_parse", parse_seconds)
+        if digest is not None:
+            self.manifest.store(file_path, phone, links, digest)
+        return unique_linkedin_urls(links)
+
+    def _add_result(self, file_path, phone, link, status, name, reason=""):
+        result = self.results.add(file_path, phone, link, status, name, reason)
+        self.journal.append(result.as_dict())
+        return result
+
+    def handle(self, record):
+        """
+        Check the links of one parsed file and return the results it produced.
+        Links whose check failed transiently wait in the retry queue (retry_failed).
+        """
+        links = self._store_record(record)
+        produced = []
+        for link in links or [""]:
+            if (record.file_path, link) in self.completed:
+                continue
+            outcome = self.check(link) if link else (False, "", "")
+            if outcome is None:
+                self.pending.setdefault(link, []).append((record.file_path, record.phone))
+            else:
+                produced.append(self._add_result(record.file_path, record.phone, link, *outcome))
+        return produced
+
+    def handle_budgeted(self, records, budget):
+        """
+        Parse everything first, then check each unique profile in scheduler priority
+        order (never checked, failed, oldest verified) until the budget runs out.
+        Results are written as soon as their profile is resolved; links not reached
+        are left for the next run. Returns the number of deferred profiles.
+        With a concurrent checker (CheckerPool) the profiles are checked in parallel.
+        """
+        references = {}  # canonical URL -> [(file_path, phone)]
+        for record in records:
+            links = self._store_record(record)
+            if not links and (record.file_path, "") not in self.completed:
+                self._add_result(record.file_path, record.phone, "", False, "")
+            for link in links:
+                if (record.file_path, link) not in self.completed:
+                    references.setdefault(link, []).append((record.file_path, record.phone))
+
+        def resolve(link, outcome):
+            if outcome is None:
+                self.pending.setdefault(link, []).extend(references.pop(link))
+                return
+            for file_path, phone in references.pop(link):
+                self._add_result(file_path, phone, link, *outcome)
+
+        # Links with a fresh cached result cost nothing, so they never count against the budget
+        if self.cache and self.max_age is not None:
+            for link in list(references):
+                cached = self.cache.get(link, self.max_age)
+                if cached is not None:
+                    self.checked[link] = cached
+                    resolve(link, self.checked[link])
+
+        def scheduled():
+            # Consumed lazily by the checker, so no new check starts once the budget is spent
+            for link in prioritize(list(references), self.cache):
+                if budget.exhausted(self.submitted):
+                    return
+                self.submitted += 1
+                yield link
+
+        if references:
+            self.start()
+        for link, result, elapsed in self.checker.check_many(scheduled()):
+            resolve(link, self._record_check(link, result, elapsed))
+
+        if references:
+            logger.info(f"Budget reached: {len(references)} profiles deferred to the next run")
+        METRICS.incr("profiles_deferred", len(references))
+        return len(references)
+
+    def handle_concurrent(self, records):
+        """
+        Check links with a concurrent checker (CheckerPool) while files are still being
+        parsed: each new link is submitted as soon as its file arrives and finished checks
+        are collected between files, so every session stays busy without parsing everything first.
+        """
+        in_flight = {}  # canonical URL -> [(file_path, phone)] waiting for a submitted check
+
+        def collect(finished):
+            for link, result, elapsed in finished:
+                outcome = self._record_check(link, result, elapsed)
+                for file_path, phone in in_flight.pop(link):
+                    if outcome is None:
+                        self.pending.setdefault(link, []).append((file_path, phone))
+                    else:
+                        self._add_result(file_path, phone, link, *outcome)
+
+        for record in records:
+            links = self._store_record(record)
+            for link in links or [""]:
+                if (record.file_path, link) in self.completed:
+                    continue
+                if link in in_flight:
+                    in_flight[link].append((record.file_path, record.phone))
+                    continue
+                outcome = self._known(link) if link else (False, "", "")
+                if outcome is _UNKNOWN:
+                    self.start()
+                    self.submitted += 1
+                    in_flight[link] = [(record.file_path, record.phone)]
+                    self.checker.submit(link)
+                elif outcome is None:
+                    self.pending.setdefault(link, []).append((record.file_path, record.phone))
+                else:
+                    self._add_result(record.file_path, record.phone, link, *outcome)
+            collect(self.checker.completed())
+        collect(self.checker.completed(wait=True))
+
+    def _known(self, link):
+        """
+        Outcome of a link already settled without the checker: None if it waits for a
+        retry, the in-run memo, or a fresh cache entry. _UNKNOWN if it needs a check.
+        """
+        if link in self.pending:
+            return None
+        if link in self.checked:
+            METRICS.incr("profiles_reused_in_run")
+            return self.checked[link]
+
+        cached = self.cache.get(link, self.max_age) if self.cache and self.max_age is not None else None
+        if cached is not None:
+            self.checked[link] = cached
+            return self.checked[link]
+        return _UNKNOWN
+
+    def check(self, link):
+        """
+        Return (status, name, reason) for a canonical profile URL, going through the
+        in-run memo and the profile cache before the checker. reason is the failure
+        class of a definite failure (not-found, redirected-away). Returns None when
+        the check failed transiently (timeout, driver-error, session-expired) and the link is queued for retry.
+        """
+        outcome = self._known(link)
+        if outcome is not _UNKNOWN:
+            return outcome
+
+        self.start()
+        self.submitted += 1
+        started = time.perf_counter()
+        try:
+            result = self.checker.check(link)
+        except Exception as e:
+            result = e
+        return self._record_check(link, result, time.perf_counter() - started)
+
+    def _record_check(self, link, result, elapsed):
+        """
+        Account for one checker call; result is (status, name) or the exception it raised.
+        Transient failures are not memoized or cached and return None; a driver error
+        or an expired session also restarts the checker (a new login).
+        """
+        if isinstance(result, Exception):
+            kind = failure_kind(result)
+            METRICS.incr(f"check_failures_{kind}")
+            if kind in TRANSIENT_FAILURES:
+                self.failures[link] = kind
+                if kind in RESTART_FAILURES:
+                    self._restart_checker(result)
+                return None
+            status, name, reason = False, "", kind
+        else:
+            (status, name), reason = result, ""
+
+        METRICS.observe("profile_check", elapsed)
+        self.check_time += elapsed
+        self.checks += 1
+        METRICS.incr("profiles_checked")
+        if self.cache:
+            self.cache.put(link, status, name, reason)
+        self.checked[link] = (status, name, reason)
+        return self.checked[link]
+
+    def _restart_checker(self, error):
+        logger.info(f"Profile checker failed ({error}); restarting it")
+        try:
+            self.checker.restart()
+        except Exception as e:
+            raise CheckerStartError(e) from e
+
+    def retry_failed(self, budget=None):
+        """
+        End-of-run retry queue: re-check the links whose check failed transiently, waiting
+        retry_backoff * 2**attempt seconds before each round. Links still failing after the
+        last round are recorded as failed with their failure class, so the next run checks
+        them again. Retries count against the budget like first checks; links the budget
+        does not reach stay out of the journal. Returns the results produced.
+        """
+        produced = []
+        for attempt in range(self.retries):
+            if not self.pending or (budget and budget.exhausted(self.submitted)):
+                break
+            delay = self.retry_backoff * 2 ** attempt
+            print(f"[INFO] Retrying {len(self.pending)} profiles in {delay:g}s "
+                  f"(attempt {attempt + 1}/{self.retries})")
+            time.sleep(delay)
+            produced.extend(self.retry_round(budget))
+
+        if budget and budget.exhausted(self.submitted):
+            # Not given up on: left out of the journal so the next run checks them
+            return produced
+        produced.extend(self.give_up())
+        return produced
+
+    def retry_round(self, budget=None):
+        """
+        Re-check every pending link once, without waiting. Links failing again, and those
+        the budget does not reach, stay pending. Returns the results produced.
+        """
+        produced = []
+
+        def scheduled(links):
+            for link in links:
+                if budget and budget.exhausted(self.submitted):
+                    return
+                self.submitted += 1
+                METRICS.incr("check_retries")
+                yield link
+
+        waiting, self.pending = self.pending, {}
+        for link, result, elapsed in self.checker.check_many(scheduled(list(waiting))):
+            outcome = self._record_check(link, result, elapsed)
+            if outcome is None:
+                self.pending[link] = waiting.pop(link)
+                continue
+            for file_path, phone in waiting.pop(link):
+                produced.append(self._add_result(file_path, phone, link, *outcome))
+        # Not submitted before the budget ran out
+        self.pending.update(waiting)
+        return produced
+
+    def give_up(self):
+        """
+        Record the links still pending as failed with the class of their last failure.
+        """
+        produced = []
+        for link, references in self.pending.items():
+            for file_path, phone in references:
+                produced.append(self._add_result(file_path, phone, link, False, "", self.failures[link]))
+        self.pending = {}
+        return produced
+
+    def close(self):
+        self.checker.close()
+        self.manifest.close()
+        logger.info(f"Processed {METRICS.counters.get('files_processed', 0)} DOCX files")
+        self.journal.close()
+        if self.checks:
+            logger.info(f"Checked {self.checks} profiles in {self.check_time:.2f}s "
+                        f"({self.checks / max(self.check_time, 1e-9):.2f} profiles/s)")
+        if self.cache:
+            logger.info(f"Profile cache: {self.cache.hits} hits, {self.cache.misses} misses")
+            METRICS.incr("profile_cache_hits", self.cache.hits)
+            METRICS.incr("profile_cache_misses", self.cache.misses)
+            self.cache.close()
@@ -0,0 +1,91 @@
+# profile_cache.py
+import os
+import time
+import sqlite3
+from utils import CommitBatcher
+
+CACHE_FILE = "profile_cache.db"
+
+# Checks are slow, so batches stay small: a crash loses at most this many
+# cached checks, which the next run performs again
+COMMIT_EVERY = 20
+
+
+class ProfileCache:
+    """
+    Persistent cache of LinkedIn profile checks keyed by URL.
+    Each entry keeps the status, the profile name, the failure class of a failed
+    check (not-found, redirected-away) and when it was checked.
+    """
+
+    def __init__(self, db_path):
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS profiles (
+                url TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                checked_at REAL NOT NULL,
+                reason TEXT NOT NULL DEFAULT ''
+            )
+        """)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(profiles)")}
+        if "reason" not in columns:
+            # Caches from before failure classes: their failed entries keep an empty reason
+            self.conn.execute("ALTER TABLE profiles ADD COLUMN reason TEXT NOT NULL DEFAULT ''")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_profiles_checked_at ON profiles (checked_at)")
+        self.conn.commit()
+        self.batch = CommitBatcher(self.conn, COMMIT_EVERY)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url, max_age):
+        """
+        Return (status, name, reason) if the URL was checked less than `max_age` seconds ago, else None.
+        """
+        row = self.conn.execute(
+            "SELECT status, name, reason FROM profiles WHERE url = ? AND checked_at >= ?",
+            (url, time.time() - max_age)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return bool(row[0]), row[1], row[2]
+
+    def last_checks(self, urls):
+        """
+        Return {url: (status, checked_at)} for the URLs that have been checked before, whatever their age.
+        """
+        history = {}
+        urls = list(urls)
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(urls), 500):
+            chunk = urls[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT url, status, checked_at FROM profiles WHERE url IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            for url, status, checked_at in rows:
+                history[url] = (bool(status), checked_at)
+        return history
+
+    def put(self, url, status, name, reason=""):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO profiles (url, status, name, checked_at, reason) VALUES (?, ?, ?, ?, ?)",
+            (url, int(bool(status)), name or "", time.time(), reason or "")
+        )
+        self.batch.wrote()
+
+    def evict_expired(self, max_age):
+        """
+        Delete entries older than `max_age` seconds and return how many were removed.
+        """
+        cursor = self.conn.execute("DELETE FROM profiles WHERE checked_at < ?", (time.time() - max_age,))
+        self.batch.commit()
+        return cursor.rowcount
+
+    def close(self):
+        self.batch.commit()
+        self.conn.close()
@@ -0,0 +1,112 @@
+# result_table.py
+import os
+import sys
+
+
+class FileEntry:
+    """
+    One scanned file. Shared by all result rows of that file, so its path, file name
+    and folder name are stored once (the names are interned across files).
+    """
+    __slots__ = ("full_path", "file_name", "folder_name")
+
+    def __init__(self, full_path):
+        self.full_path = full_path
+        self.file_name = sys.intern(os.path.basename(full_path))
+        self.folder_name = sys.intern(os.path.basename(os.path.dirname(full_path)))
+
+
+class ResultRecord:
+    """
+    One checked link of one file. reason is the failure class when status is False
+    (not-found, redirected-away, timeout, driver-error), or "".
+    """
+    __slots__ = ("file", "phone", "link", "name", "status", "reason")
+
+    def __init__(self, file, phone, link, name, status, reason=""):
+        self.file = file
+        self.phone = phone
+        self.link = link
+        self.name = name
+        self.status = status
+        self.reason = reason
+
+    @property
+    def full_path(self):
+        return self.file.full_path
+
+    @property
+    def file_name(self):
+        return self.file.file_name
+
+    @property
+    def folder_name(self):
+        return self.file.folder_name
+
+    def as_dict(self):
+        return {
+            "file_name": self.file_name,
+            "full_path": self.full_path,
+            "folder_name": self.folder_name,
+            "phone": self.phone,
+            "link": self.link,
+            "name": self.name,
+            "status": self.status,
+            "reason": self.reason
+        }
+
+
+class ResultTable:
+    """
+    The results of a run, in insertion order, read directly by the report writers.
+    Rows are deduplicated on insert: the first result for each (full_path, link) pair is kept,
+    so copies of a CV in different folders each keep their own row.
+    Accepts ResultRecords or result dicts (e.g. replayed from the journal).
+    """
+
+    def __init__(self, rows=()):
+        self.records = []
+        self.files = {}  # full_path -> FileEntry
+        self.keys = set()
+        self.extend(rows)
+
+    def add(self, full_path, phone, link, status, name, reason=""):
+        """
+        Record one result and return its ResultRecord; a duplicate row is returned but not stored.
+        """
+        file = self.files.get(full_path)
+        if file is None:
+            file = self.files[full_path] = FileEntry(full_path)
+        record = ResultRecord(file, phone, link, name, bool(status), reason)
+        self._insert(record)
+        return record
+
+    def append(self, record):
+        if record.full_path not in self.files:
+            self.files[record.full_path] = record.file
+        self._insert(record)
+
+    def _insert(self, record):
+        key = (record.full_path, record.link)
+        if key not in self.keys:
+            self.keys.add(key)
+            self.records.append(record)
+
+    def extend(self, rows):
+        for row in rows:
+            if isinstance(row, ResultRecord):
+                self.append(row)
+            else:
+                self.add(row["full_path"], row["phone"], row["link"], row.get("status", False), row["name"],
+                         row.get("reason", ""))
+
+    def clear(self):
+        self.records.clear()
+        self.files.clear()
+        self.keys.clear()
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
@@ -0,0 +1,188 @@
+# run_history.py
+import os
+import time
+import sqlite3
+from result_table import ResultTable
+
+HISTORY_FILE = "history.db"
+
+RUN_COMPLETE = "complete"
+RUN_INTERRUPTED = "interrupted"
+RUN_FAILED = "failed"  # the profile checker could not start or restart
+
+MERGE_PREFIX = "merge: "  # root of a run that combined shard results
+
+
+class RunHistory:
+    """
+    Every run's results, kept in SQLite so reports, per-folder views and diffs
+    between runs can be rebuilt without checking any profile again.
+    Each result keeps its directory relative to the scanned root ("Client Alpha/August2025"),
+    so a folder filter covers everything under it. Results are indexed on run and
+    directory, link and status; runs on start time.
+    """
+
+    def __init__(self, db_path):
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                root TEXT NOT NULL,
+                started_at REAL NOT NULL,
+                finished_at REAL,
+                state TEXT NOT NULL,
+                result_count INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS results (
+                run_id INTEGER NOT NULL REFERENCES runs (id),
+                full_path TEXT NOT NULL,
+                folder_name TEXT NOT NULL,
+                phone TEXT NOT NULL,
+                link TEXT NOT NULL,
+                name TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                reason TEXT NOT NULL,
+                directory TEXT NOT NULL DEFAULT ''
+            );
+        """)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(results)")}
+        if "directory" not in columns:
+            self.conn.execute("ALTER TABLE results ADD COLUMN directory TEXT NOT NULL DEFAULT ''")
+            self._backfill_directories()
+        self.conn.executescript("""
+            DROP INDEX IF EXISTS idx_results_folder;
+            CREATE INDEX IF NOT EXISTS idx_runs_started_at ON runs (started_at);
+            CREATE INDEX IF NOT EXISTS idx_results_run ON results (run_id);
+            CREATE INDEX IF NOT EXISTS idx_results_directory ON results (run_id, directory);
+            CREATE INDEX IF NOT EXISTS idx_results_link ON results (link);
+            CREATE INDEX IF NOT EXISTS idx_results_status ON results (status, run_id);
+        """)
+        self.conn.commit()
+
+    def _backfill_directories(self):
+        # Histories from before the directory column: runs of a folder use it as the base,
+        # merged runs the deepest folder their files share
+        runs = self.conn.execute("SELECT id, root FROM runs").fetchall()
+        for run_id, root in runs:
+            rows = self.conn.execute("SELECT rowid, full_path FROM results WHERE run_id = ?", (run_id,)).fetchall()
+            base = common_directory(path for _, path in rows) if root.startswith(MERGE_PREFIX) else root
+            self.conn.executemany("UPDATE results SET directory = ? WHERE rowid = ?",
+                                  ((relative_directory(path, base), rowid) for rowid, path in rows))
+
+    def record_run(self, root, results, started_at, state=RUN_COMPLETE, base=None):
+        """
+        Store the results of one run (ResultRecords) and return its id.
+        root describes what was scanned (the folder, or the shards a merge combined);
+        directories are stored relative to base, the scanned folder (default: root).
+        """
+        base = root if base is None else base
+        cursor = self.conn.execute(
+            "INSERT INTO runs (root, started_at, finished_at, state, result_count) VALUES (?, ?, ?, ?, ?)",
+            (root, started_at, time.time(), state, len(results))
+        )
+        run_id = cursor.lastrowid
+        self.conn.executemany(
+            "INSERT INTO results (run_id, full_path, folder_name, phone, link, name, status, reason, directory) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            ((run_id, r.full_path, r.folder_name, r.phone or "", r.link, r.name or "", int(r.status), r.reason or "",
+              relative_directory(r.full_path, base)) for r in results)
+        )
+        self.conn.commit()
+        return run_id
+
+    def runs(self, limit=20):
+        """
+        Return the most recent runs as (id, root, started_at, state, result_count), newest first.
+        """
+        return self.conn.execute(
+            "SELECT id, root, started_at, state, result_count FROM runs ORDER BY started_at DESC LIMIT ?",
+            (limit,)
+        ).fetchall()
+
+    def started_at(self, run_id):
+        row = self.conn.execute("SELECT started_at FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return row[0] if row else None
+
+    def latest_run(self, before=None):
+        """
+        Id of the latest complete run, optionally the latest one started before `before` (epoch seconds).
+        """
+        query = "SELECT id FROM runs WHERE state = ?"
+        params = [RUN_COMPLETE]
+        if before is not None:
+            query += " AND started_at < ?"
+            params.append(before)
+        row = self.conn.execute(query + " ORDER BY started_at DESC LIMIT 1", params).fetchone()
+        return row[0] if row else None
+
+    def load(self, run_id, folder=None, status=None):
+        """
+        Return the results of a run as a ResultTable, optionally only one folder and
+        everything under it (a path relative to the scanned root, e.g. "Client Alpha"
+        or "Client Alpha/August2025") and/or one status (True valid, False invalid).
+        """
+        query = "SELECT full_path, phone, link, status, name, reason FROM results WHERE run_id = ?"
+        params = [run_id]
+        if folder is not None:
+            folder = folder.replace("\\", "/").strip("/")
+            # A range instead of LIKE, so the (run_id, directory) index is used; "0" sorts right after "/"
+            query += " AND (directory = ? OR (directory >= ? AND directory < ?))"
+            params.extend([folder, folder + "/", folder + "0"])
+        if status is not None:
+            query += " AND status = ?"
+            params.append(int(status))
+        table = ResultTable()
+        for full_path, phone, link, row_status, name, reason in self.conn.execute(query + " ORDER BY rowid", params):
+            table.add(full_path, phone, link, row_status, name, reason)
+        return table
+
+    def close(self):
+        self.conn.close()
+
+
+def relative_directory(full_path, base):
+    """
+    Directory of a file relative to base, with "/" separators ("" for a file directly in base).
+    Files outside base keep their absolute directory.
+    """
+    directory = os.path.abspath(os.path.dirname(full_path))
+    if base:
+        try:
+            relative = os.path.relpath(directory, os.path.abspath(base))
+        except ValueError:  # another drive
+            relative = os.pardir
+        if not relative.startswith(os.pardir):
+            return "" if relative == os.curdir else relative.replace(os.sep, "/")
+    return directory.replace(os.sep, "/")
+
+
+def common_directory(paths):
+    """
+    Deepest folder shared by the given file paths ("" if there is none).
+    """
+    try:
+        return os.path.commonpath([os.path.dirname(path) for path in paths])
+    except ValueError:
+        return ""
+
+
+def diff_results(old, new):
+    """
+    Compare two result sets by (full_path, link).
+    Returns (added, removed, changed): ResultTables of rows only in `new`, rows only
+    in `old`, and rows of `new` whose status changed since `old`.
+    """
+    old_rows = {(r.full_path, r.link): r for r in old}
+    new_keys = set()
+    added, changed = ResultTable(), ResultTable()
+    for row in new:
+        key = (row.full_path, row.link)
+        new_keys.add(key)
+        previous = old_rows.get(key)
+        if previous is None:
+            added.append(row)
+        elif previous.status != row.status:
+            changed.append(row)
+    removed = ResultTable(row for key, row in old_rows.items() if key not in new_keys)
+    return added, removed, changed
@@ -0,0 +1,112 @@
+# scan_manifest.py
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from utils import file_digest, CommitBatcher
+from file_reader import EXTRACTOR_VERSION
+
+MANIFEST_FILE = "scan_manifest.db"
+
+# One row is stored per parsed file, up to hundreds per second; a crash only loses
+# the last uncommitted rows, and those files are simply parsed again
+COMMIT_EVERY = 100
+
+
+class ScanManifest:
+    """
+    Persistent record of what was extracted from each DOCX file.
+    Entries are keyed by path and validated against size, mtime and content hash,
+    so unchanged files are not parsed again between runs. Entries written by another
+    extractor version are dropped on open, so every file is parsed again after an upgrade.
+    The connection is shared between the extraction thread (lookups) and the
+    checking loop (stores), so every access goes through one lock.
+    """
+
+    def __init__(self, db_path, version=EXTRACTOR_VERSION):
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                digest TEXT NOT NULL,
+                phone TEXT NOT NULL,
+                links TEXT NOT NULL,
+                scanned_at TEXT NOT NULL,
+                extractor_version INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(files)")}
+        if "extractor_version" not in columns:
+            # Manifests from before versioning: their entries count as version 0
+            self.conn.execute("ALTER TABLE files ADD COLUMN extractor_version INTEGER NOT NULL DEFAULT 0")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_files_digest ON files (digest)")
+        self.version = version
+        stale = self.conn.execute("DELETE FROM files WHERE extractor_version != ?", (version,)).rowcount
+        if stale:
+            print(f"[INFO] Extractor changed: {stale} files will be parsed again.")
+        self.conn.commit()
+        self.batch = CommitBatcher(self.conn, COMMIT_EVERY)
+
+    def lookup(self, file_path):
+        """
+        Return the stored (phone, links) for a file if it has not changed, else None.
+        Size and mtime are checked first; the content hash is only computed when
+        the mtime moved but the size did not (e.g. a file copied over itself).
+        """
+        with self.lock:
+            return self._lookup(file_path)
+
+    def _lookup(self, file_path):
+        row = self.conn.execute(
+            "SELECT size, mtime_ns, digest, phone, links FROM files WHERE path = ?",
+            (file_path,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        size, mtime_ns, digest, phone, links = row
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        if stat.st_size != size:
+            return None
+        if stat.st_mtime_ns != mtime_ns:
+            if file_digest(file_path) != digest:
+                return None
+            self.conn.execute("UPDATE files SET mtime_ns = ? WHERE path = ?", (stat.st_mtime_ns, file_path))
+            self.batch.wrote()
+
+        return phone, json.loads(links)
+
+    def store(self, file_path, phone, links, digest):
+        """
+        Record the extraction result of a freshly parsed file.
+        """
+        with self.lock:
+            self._store(file_path, phone, links, digest)
+
+    def _store(self, file_path, phone, links, digest):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return
+        self.conn.execute(
+            "INSERT OR REPLACE INTO files (path, size, mtime_ns, digest, phone, links, scanned_at, extractor_version) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (file_path, stat.st_size, stat.st_mtime_ns, digest, phone, json.dumps(links),
+             datetime.now().isoformat(timespec="seconds"), self.version)
+        )
+        self.batch.wrote()
+
+    def close(self):
+        with self.lock:
+            self.batch.commit()
+            self.conn.close()
+
@@ -0,0 +1,44 @@
+# scheduler.py
+import time
+
+# Lower runs first
+PRIORITY_NEVER_CHECKED = 0
+PRIORITY_FAILED = 1
+PRIORITY_VERIFIED = 2
+
+
+def prioritize(links, cache=None):
+    """
+    Order profile links for checking: never-checked first, then links whose last
+    check failed, then the rest by oldest last verification. Ties keep their order.
+    """
+    history = cache.last_checks(links) if cache else {}
+
+    def priority(link):
+        if link not in history:
+            return PRIORITY_NEVER_CHECKED, 0.0
+        status, checked_at = history[link]
+        return (PRIORITY_VERIFIED if status else PRIORITY_FAILED), checked_at
+
+    return sorted(links, key=priority)
+
+
+class Budget:
+    """
+    Limits a run to a number of profile checks and/or minutes of wall time.
+    """
+
+    def __init__(self, profiles=None, minutes=None):
+        self.profiles = profiles
+        self.minutes = minutes
+        self.started = time.monotonic()
+
+    def __bool__(self):
+        return self.profiles is not None or self.minutes is not None
+
+    def exhausted(self, checks_done):
+        if self.profiles is not None and checks_done >= self.profiles:
+            return True
+        if self.minutes is not None and time.monotonic() - self.started >= self.minutes * 60:
+            return True
+        return False
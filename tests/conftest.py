@@ -0,0 +1,25 @@
+# tests/conftest.py
+import os
+import sys
+
+import pytest
+from docx import Document
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def make_cv(tmp_path):
+    """
+    Write a one-page CV with the given phone and LinkedIn link, returning its path.
+    """
+    def make(relative_path, link, phone="0501234567"):
+        path = tmp_path / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        document = Document()
+        document.add_paragraph("Ahmed Hassan")
+        document.add_paragraph(f"Mobile: {phone}")
+        document.add_paragraph(f"LinkedIn: {link}")
+        document.save(str(path))
+        return str(path)
+    return make
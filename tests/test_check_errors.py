@@ -0,0 +1,16 @@
+# tests/test_check_errors.py
+import pytest
+
+from check_errors import classify_redirect, NOT_FOUND, REDIRECTED_AWAY, SESSION_EXPIRED
+
+
+@pytest.mark.parametrize("url, kind", [
+    ("https://www.linkedin.com/404/", NOT_FOUND),
+    ("https://www.linkedin.com/authwall?trk=public_profile", SESSION_EXPIRED),
+    ("https://www.linkedin.com/uas/login?session_redirect=x", SESSION_EXPIRED),
+    ("https://www.linkedin.com/checkpoint/challenge/", SESSION_EXPIRED),
+    ("https://www.linkedin.com/", SESSION_EXPIRED),
+    ("https://www.linkedin.com/feed/", REDIRECTED_AWAY),
+])
+def test_classify_redirect(url, kind):
+    assert classify_redirect(url) == kind
@@ -0,0 +1,60 @@
+# tests/test_file_reader.py
+import shutil
+import hashlib
+from collections import Counter
+
+import file_reader
+from file_reader import ContactRecord, stream_contact_info
+
+
+def counting_digests(monkeypatch):
+    hashed = Counter()
+    digest = file_reader.file_digest
+
+    def count(file_path):
+        hashed[file_path] += 1
+        return digest(file_path)
+
+    monkeypatch.setattr(file_reader, "file_digest", count)
+    return hashed
+
+
+def test_copies_are_parsed_once_and_hashed_once(tmp_path, make_cv, monkeypatch):
+    original = make_cv("cvs/Ahmed.docx", "https://www.linkedin.com/in/ahmed-hassan")
+    copies = [str(tmp_path / "cvs" / f"Ahmed ({i}).docx") for i in range(3)]
+    for copy in copies:
+        shutil.copy(original, copy)
+    other = make_cv("cvs/Sara.docx", "https://www.linkedin.com/in/sara-saleh", phone="0551234567")
+    hashed = counting_digests(monkeypatch)
+
+    records = {r.file_path: r for r in stream_contact_info([original, *copies, other], workers=1)}
+
+    assert set(records) == {original, *copies, other}
+    assert all(records[copy].phone == records[original].phone for copy in copies)
+    assert all(records[copy].parse_seconds is None for copy in copies)
+    assert len({records[path].digest for path in (original, *copies)}) == 1
+    assert max(hashed.values()) == 1
+
+
+def test_same_size_files_are_compared_once_the_first_is_parsed(tmp_path, monkeypatch):
+    paths = {}
+    for name, content in [("a", b"AAAA"), ("b", b"AAAA"), ("c", b"BBBB"), ("d", b"BBBB")]:
+        paths[name] = str(tmp_path / f"{name}.docx")
+        with open(paths[name], "wb") as f:
+            f.write(content)
+    digest_a, digest_c = hashlib.sha1(b"AAAA").hexdigest(), hashlib.sha1(b"BBBB").hexdigest()
+    hashed = counting_digests(monkeypatch)
+    index = file_reader._DuplicateIndex()
+
+    # a is parsed (and hashed) by a worker; b and c wait for it
+    assert index.route(paths["a"]) == (True, None, None)
+    assert index.route(paths["b"]) == (False, digest_a, None)
+    assert index.route(paths["c"]) == (False, digest_c, None)
+
+    copies, unmatched = index.resolve(ContactRecord(paths["a"], "+966501234567", [], digest_a, 0.1))
+    assert [r.file_path for r in copies] == [paths["b"]]
+    assert unmatched == [(paths["c"], digest_c)]
+
+    index.resolve(ContactRecord(paths["c"], "N/A", [], digest_c, 0.1))
+    assert index.route(paths["d"])[2].file_path == paths["d"]
+    assert paths["a"] not in hashed
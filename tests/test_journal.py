@@ -0,0 +1,21 @@
+# tests/test_journal.py
+from journal import ResultJournal, read_journal
+
+
+def row(link, status):
+    return {"full_path": "/cvs/Ahmed.docx", "phone": "N/A", "link": link, "name": "", "status": status}
+
+
+def test_compact_keeps_only_current_rows(tmp_path):
+    path = str(tmp_path / "watch_journal.jsonl")
+    journal = ResultJournal(path)
+    for status in (False, False, True):
+        journal.append(row("https://www.linkedin.com/in/ahmed", status))
+
+    journal.compact([row("https://www.linkedin.com/in/ahmed", True)])
+    journal.append(row("https://www.linkedin.com/in/sara", True))
+    journal.close()
+
+    assert read_journal(path) == [row("https://www.linkedin.com/in/ahmed", True),
+                                  row("https://www.linkedin.com/in/sara", True)]
+    assert journal.lines == 2
@@ -0,0 +1,89 @@
+# tests/test_main.py
+import os
+
+import pytest
+
+import Main
+from checker_backend import ProfileChecker
+from run_history import RunHistory, HISTORY_FILE
+
+
+class LiveChecker(ProfileChecker):
+    live = True
+
+    def check(self, url):
+        return True, "Ahmed Hassan"
+
+
+class BrokenChecker(LiveChecker):
+    def start(self):
+        raise RuntimeError("chrome not found")
+
+
+@pytest.fixture
+def status_dir(tmp_path, monkeypatch):
+    path = str(tmp_path / "Status")
+    monkeypatch.setattr(Main, "STATUS_DIR", path)
+    return path
+
+
+def latest_run(status_dir):
+    history = RunHistory(os.path.join(status_dir, HISTORY_FILE))
+    try:
+        return history.latest_run()
+    finally:
+        history.close()
+
+
+def test_checker_start_error_keeps_latest_run(tmp_path, status_dir, make_cv):
+    make_cv("first/Ahmed.docx", "https://www.linkedin.com/in/ahmed-hassan")
+    Main.main(str(tmp_path / "first"), checker=LiveChecker())
+    complete = latest_run(status_dir)
+    assert complete is not None
+
+    make_cv("second/Sara.docx", "https://www.linkedin.com/in/sara-saleh")
+    reports = sorted(os.listdir(status_dir))
+    Main.main(str(tmp_path / "second"), checker=BrokenChecker())
+
+    assert latest_run(status_dir) == complete
+    assert sorted(os.listdir(status_dir)) == reports
+
+
+def test_mock_runs_stay_out_of_the_history(tmp_path, status_dir, make_cv):
+    make_cv("cvs/Ahmed.docx", "https://www.linkedin.com/in/ahmed-hassan")
+    Main.main(str(tmp_path / "cvs"), test_mode=True)
+    assert latest_run(status_dir) is None
+
+
+def test_scan_is_the_default_command():
+    assert Main.parse_args(["./resumes", "--test"]).command == "scan"
+    assert Main.parse_args(["scan", "./resumes"]).folder_path == "./resumes"
+    assert Main.parse_args(["report", "--run", "3"]).run == 3
+    assert Main.parse_args(["merge", "a", "b"]).sources == ["a", "b"]
+
+
+def test_merged_mock_shards_stay_out_of_the_history(tmp_path, status_dir, make_cv):
+    for i in range(4):
+        make_cv(f"cvs/CV_{i}.docx", f"https://www.linkedin.com/in/user-{i}")
+    for index in (1, 2):
+        Main.main(str(tmp_path / "cvs"), test_mode=True, shard=(index, 2))
+
+    assert len(Main.merge()) == 4
+    assert latest_run(status_dir) is None
+
+
+def test_merged_live_shards_are_recorded(tmp_path, status_dir, make_cv):
+    for i in range(4):
+        make_cv(f"cvs/Client {i % 2}/June/CV_{i}.docx", f"https://www.linkedin.com/in/user-{i}")
+    for index in (1, 2):
+        Main.main(str(tmp_path / "cvs"), checker=LiveChecker(), shard=(index, 2))
+
+    Main.merge()
+    history = RunHistory(os.path.join(status_dir, HISTORY_FILE))
+    try:
+        run_id, root = history.runs(limit=1)[0][:2]
+        client = history.load(run_id, folder="Client 1")
+    finally:
+        history.close()
+    assert root.startswith("merge: ")
+    assert sorted(r.file.file_name for r in client) == ["CV_1.docx", "CV_3.docx"]
@@ -0,0 +1,123 @@
+# tests/test_pipeline.py
+import time
+
+from checker_backend import ProfileChecker
+from checker_pool import CheckerPool, TokenBucket
+from check_errors import ProfileCheckError, TIMEOUT, DRIVER_ERROR
+from file_reader import ContactRecord
+from pipeline import Verifier
+from scheduler import Budget
+
+
+class FlakyChecker(ProfileChecker):
+    """
+    Times out on every link ending in an odd digit.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def check(self, url):
+        self.calls += 1
+        if int(url[-1]) % 2:
+            raise ProfileCheckError(TIMEOUT, url)
+        return True, "Ahmed Hassan"
+
+
+def records(count):
+    for i in range(count):
+        yield ContactRecord(f"/cvs/{i}.docx", "N/A", [f"https://www.linkedin.com/in/user-{i}"], None, None)
+
+
+def test_retries_count_against_the_budget(tmp_path):
+    checker = FlakyChecker()
+    verifier = Verifier(checker, str(tmp_path), retry_backoff=0)
+    budget = Budget(profiles=10)
+    try:
+        verifier.handle_budgeted(records(8), budget)
+        verifier.retry_failed(budget)
+    finally:
+        verifier.close()
+
+    assert checker.calls <= 10
+    # The timeouts the budget did not reach are left for the next run
+    assert verifier.pending
+    assert all(record.status for record in verifier.results)
+
+
+class SlowChecker(ProfileChecker):
+    def check(self, url):
+        time.sleep(0.01)
+        return True, "Ahmed Hassan"
+
+
+def test_pool_checks_while_files_are_parsed(tmp_path):
+    pool = CheckerPool(lambda index: SlowChecker(), size=2)
+    verifier = Verifier(pool, str(tmp_path))
+    checked_before_last_file = []
+
+    def slow_parse():
+        for i, record in enumerate(records(6)):
+            if i == 5:
+                time.sleep(0.2)
+                checked_before_last_file.append(sum(worker.checks for worker in pool.workers))
+            yield record
+
+    try:
+        verifier.handle_concurrent(slow_parse())
+    finally:
+        verifier.close()
+
+    assert checked_before_last_file[0] > 0
+    assert len(verifier.results) == 6
+
+
+class CrashOnceChecker(ProfileChecker):
+    crashed = False
+
+    def check(self, url):
+        if not CrashOnceChecker.crashed:
+            CrashOnceChecker.crashed = True
+            raise ProfileCheckError(DRIVER_ERROR, url)
+        return True, "Ahmed Hassan"
+
+
+class CountingBucket(TokenBucket):
+    def __init__(self):
+        super().__init__(rate=1000.0)
+        self.acquired = 0
+
+    def acquire(self):
+        self.acquired += 1
+        super().acquire()
+
+
+class BrokenBucket(TokenBucket):
+    def acquire(self):
+        raise ValueError("broken limiter")
+
+
+def test_pool_retry_after_restart_takes_a_token():
+    pool = CheckerPool(lambda index: CrashOnceChecker())
+    pool.limiter = CountingBucket()
+    pool.start()
+    try:
+        result = pool.check("https://www.linkedin.com/in/ahmed")
+    finally:
+        pool.close()
+
+    assert result == (True, "Ahmed Hassan")
+    assert pool.limiter.acquired == 2
+
+
+def test_pool_limiter_errors_become_results():
+    pool = CheckerPool(lambda index: SlowChecker(), size=2)
+    pool.limiter = BrokenBucket(rate=1.0)
+    pool.start()
+    try:
+        done = list(pool.check_many(f"https://www.linkedin.com/in/user-{i}" for i in range(3)))
+    finally:
+        pool.close()
+
+    assert len(done) == 3
+    assert all(isinstance(result, ValueError) for _, result, _ in done)
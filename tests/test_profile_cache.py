@@ -0,0 +1,25 @@
+# tests/test_profile_cache.py
+import sqlite3
+
+from profile_cache import ProfileCache
+
+
+def test_failure_reason_survives_a_cache_hit(tmp_path):
+    cache = ProfileCache(str(tmp_path / "profile_cache.db"))
+    cache.put("https://www.linkedin.com/in/ghost", False, "", "not-found")
+    assert cache.get("https://www.linkedin.com/in/ghost", 3600) == (False, "", "not-found")
+    cache.close()
+
+
+def test_existing_cache_is_migrated(tmp_path):
+    db_path = str(tmp_path / "profile_cache.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE profiles (url TEXT PRIMARY KEY, status INTEGER NOT NULL, name TEXT NOT NULL, "
+                 "checked_at REAL NOT NULL)")
+    conn.execute("INSERT INTO profiles VALUES ('https://www.linkedin.com/in/ahmed', 1, 'Ahmed', 1e12)")
+    conn.commit()
+    conn.close()
+
+    cache = ProfileCache(db_path)
+    assert cache.get("https://www.linkedin.com/in/ahmed", 3600) == (True, "Ahmed", "")
+    cache.close()
@@ -0,0 +1,55 @@
+# tests/test_run_history.py
+import os
+import sqlite3
+
+from result_table import ResultTable
+from run_history import RunHistory
+
+
+def table(root, *relative_paths):
+    results = ResultTable()
+    for i, relative in enumerate(relative_paths):
+        results.add(os.path.join(root, *relative.split("/")), "N/A", f"https://www.linkedin.com/in/user-{i}", True, "")
+    return results
+
+
+def folder_paths(history, run_id, folder, root):
+    return sorted(os.path.relpath(r.full_path, root).replace(os.sep, "/")
+                  for r in history.load(run_id, folder=folder))
+
+
+def test_folder_filter_covers_subfolders(tmp_path):
+    root = str(tmp_path / "cvs")
+    history = RunHistory(str(tmp_path / "history.db"))
+    run_id = history.record_run(root, table(root, "Client Alpha/August2025/a.docx", "Client Alpha/b.docx",
+                                            "Client Alpha 2/c.docx", "Client Beta/August2025/d.docx", "e.docx"), 0)
+
+    assert folder_paths(history, run_id, "Client Alpha", root) == ["Client Alpha/August2025/a.docx",
+                                                                   "Client Alpha/b.docx"]
+    assert folder_paths(history, run_id, "Client Alpha/August2025/", root) == ["Client Alpha/August2025/a.docx"]
+    assert folder_paths(history, run_id, "August2025", root) == []
+    history.close()
+
+
+def test_old_histories_get_directories(tmp_path):
+    path = str(tmp_path / "history.db")
+    root = str(tmp_path / "cvs")
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE runs (id INTEGER PRIMARY KEY AUTOINCREMENT, root TEXT NOT NULL, started_at REAL NOT NULL,
+                           finished_at REAL NOT NULL, state TEXT NOT NULL DEFAULT 'complete',
+                           result_count INTEGER NOT NULL);
+        CREATE TABLE results (run_id INTEGER NOT NULL, full_path TEXT NOT NULL, folder_name TEXT NOT NULL,
+                              phone TEXT NOT NULL, link TEXT NOT NULL, name TEXT NOT NULL,
+                              status INTEGER NOT NULL, reason TEXT NOT NULL);
+        CREATE INDEX idx_results_folder ON results (folder_name, run_id);
+    """)
+    conn.execute("INSERT INTO runs VALUES (1, ?, 0, 0, 'complete', 1)", (root,))
+    conn.execute("INSERT INTO results VALUES (1, ?, 'June', 'N/A', 'https://www.linkedin.com/in/ahmed', '', 1, '')",
+                 (os.path.join(root, "Client Alpha", "June", "a.docx"),))
+    conn.commit()
+    conn.close()
+
+    history = RunHistory(path)
+    assert folder_paths(history, 1, "Client Alpha", root) == ["Client Alpha/June/a.docx"]
+    history.close()
@@ -0,0 +1,19 @@
+# tests/test_scan_manifest.py
+from scan_manifest import ScanManifest
+
+
+def test_entries_of_another_extractor_version_are_dropped(tmp_path, make_cv):
+    path = make_cv("Ahmed.docx", "https://www.linkedin.com/in/ahmed-hassan")
+    db_path = str(tmp_path / "scan_manifest.db")
+
+    manifest = ScanManifest(db_path, version=1)
+    manifest.store(path, "+966501234567", ["https://www.linkedin.com/in/ahmed-hassan"], "digest")
+    manifest.close()
+
+    manifest = ScanManifest(db_path, version=1)
+    assert manifest.lookup(path) == ("+966501234567", ["https://www.linkedin.com/in/ahmed-hassan"])
+    manifest.close()
+
+    manifest = ScanManifest(db_path, version=2)
+    assert manifest.lookup(path) is None
+    manifest.close()
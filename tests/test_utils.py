@@ -0,0 +1,61 @@
+# tests/test_utils.py
+import pytest
+
+from utils import canonicalize_linkedin_url, extract_phones, normalize_phone
+
+
+@pytest.mark.parametrize("raw, phone", [
+    ("0501234567", "+966501234567"),
+    ("050-123-4567", "+966501234567"),
+    ("+966 50 123 4567", "+966501234567"),
+    ("+966 (0) 50 123 4567", "+966501234567"),
+    ("(+966) 50 123 4567", "+966501234567"),
+    ("00966501234567", "+966501234567"),
+    ("+44 20 7946 0958", "+442079460958"),
+    ("N/A", "N/A"),
+])
+def test_normalize_phone(raw, phone):
+    assert normalize_phone(raw) == phone
+
+
+def test_extract_phones_batch():
+    groups = [
+        ["Ahmed Hassan", "Mobile: +966 (0) 50 123 4567"],
+        ["Tel: 011 456 7890", "Mobile: 055-123-4567"],
+        ["Sara Saleh", "Tel: +44 20 7946 0958"],
+        ["No contact details"],
+        ["Born 2015", "ID 12345"],
+    ]
+    assert extract_phones(groups) == ["+966501234567", "+966551234567", "+442079460958", "N/A", "N/A"]
+
+
+def test_extract_phones_does_not_match_across_files():
+    assert extract_phones([["Mobile: 05"], ["01234567"]]) == ["N/A", "01234567"]
+
+
+@pytest.mark.parametrize("raw", [
+    "https://www.linkedin.com/in/ahmed-hassan",
+    "http://www.linkedin.com/in/ahmed-hassan",
+    "www.linkedin.com/in/ahmed-hassan",
+    "linkedin.com/in/ahmed-hassan",
+    "https://linkedin.com/in/ahmed-hassan",
+    "https://sa.linkedin.com/in/ahmed-hassan",
+    "https://uk.linkedin.com/in/ahmed-hassan",
+    "https://WWW.LinkedIn.com/in/Ahmed-Hassan",
+    "https://www.linkedin.com/in/ahmed-hassan?trk=public_profile",
+    "https://www.linkedin.com/in/ahmed-hassan#experience",
+    "https://www.linkedin.com/in/ahmed-hassan/",
+    "https://www.linkedin.com/in/ahmed-hassan/details/skills/",
+    "https://www.linkedin.com/in/ahmed-hassan.",
+    "  https://www.linkedin.com/in/ahmed-hassan;",
+    "https://www.linkedin.com/in/ahmed-hassan,https://github.com/ahmed",
+    "https://www.linkedin.com/in/ahmed-hassan;https://github.com/ahmed",
+    "https://www.linkedin.com/in/ahmed-hassan|https://github.com/ahmed",
+    "https://www.linkedin.com/in/ahmed-hassan | github.com/ahmed",
+])
+def test_canonicalize_linkedin_url(raw):
+    assert canonicalize_linkedin_url(raw) == "https://www.linkedin.com/in/ahmed-hassan"
+
+
+def test_canonicalize_leaves_other_hosts():
+    assert canonicalize_linkedin_url("https://github.com/ahmed") == "https://github.com/ahmed"
@@ -0,0 +1,50 @@
+# tests/test_watcher.py
+import os
+import time
+
+from output_manager import ThrottledWriter
+from watcher import ChangeTracker, _EventHandler, _drop_rows
+
+
+class Event:
+    def __init__(self, src_path, dest_path=None, is_directory=False):
+        self.src_path = src_path
+        self.dest_path = dest_path
+        self.is_directory = is_directory
+
+
+def test_renamed_folder_drops_its_old_rows(tmp_path, make_cv):
+    root = str(tmp_path)
+    make_cv("ClientA/a.docx", "https://www.linkedin.com/in/ahmed-hassan")
+    old_dir, old_file = os.path.join(root, "Incoming"), os.path.join(root, "Incoming", "a.docx")
+    rows_by_path = {old_file: ["row"], os.path.join(root, "IncomingOther", "b.docx"): ["row"]}
+
+    tracker = ChangeTracker(root, [], settle=0)
+    _EventHandler(tracker).on_moved(Event(old_dir, os.path.join(root, "ClientA"), is_directory=True))
+    changed, deleted = tracker.pop_ready()
+    for path in deleted:
+        _drop_rows(rows_by_path, path)
+
+    assert changed == [os.path.join(root, "ClientA", "a.docx")]
+    assert list(rows_by_path) == [os.path.join(root, "IncomingOther", "b.docx")]
+
+
+def test_deleted_folder_drops_its_rows(tmp_path):
+    folder = str(tmp_path / "ClientA")
+    rows_by_path = {os.path.join(folder, "Month", "a.docx"): ["row"]}
+    tracker = ChangeTracker(str(tmp_path), [], settle=0)
+    _EventHandler(tracker).on_deleted(Event(folder, is_directory=True))
+    for path in tracker.pop_ready()[1]:
+        _drop_rows(rows_by_path, path)
+    assert rows_by_path == {}
+
+
+def test_throttled_writer_skips_superseded_results():
+    written = []
+    writer = ThrottledWriter(written.append, interval=60)
+    writer.update("first")
+    time.sleep(0.1)
+    writer.update("second")
+    writer.update("third")
+    writer.close()
+    assert written == ["first", "third"]
@@ -1,48 +1,227 @@
 # utils.py
 import re
 import time
+import bisect
+import hashlib
+import itertools
+from urllib.parse import urlsplit
 from functools import wraps
 from logging import Logger
 
-# Regex for extracting phone numbers
+# Saudi mobile numbers: +966 5X XXX XXXX, 05X XXX XXXX, 5X XXX XXXX, (+966) ..., +966 (0) 5..., 00966 5...
+# The leading lookahead lets the engine skip positions that cannot start a number
 PHONE_REGEX = re.compile(
-    r"(\+966\s?\d{1,3}\s?\d{3}\s?\d{3,4}|\+966\s?0?\d{9}|\b0\d{9}\b|\b0\d{2}\s?\d{3}\s?\d{4})"
+    r"(?=[(+05])(?<![\d+])(?:\(?(?:\+|00)966\)?|0)?[\s-]*(?:\(0\)|0)?[\s-]*5(?:[\s-]*\d){8}(?!\d)"
 )
 
-import re
-
-PHONE_REGEX = re.compile(
-    r"(?:\+966|\(?\+966\)?|0)?[\s-]*5(?:[\s-]*\d){8}"
+# Any other phone-like number; a match needs at least MIN_PHONE_DIGITS digits
+PHONE_PATTERN = re.compile(
+    r"(\+?\d{1,4}[\s-]?\(?\d+\)?[\s-]?\d+[\s-]?\d+)"
 )
+MIN_PHONE_DIGITS = 7
+
+NON_DIGIT = re.compile(r"\D")
+
+# Everything but digits and "+", i.e. spaces, dashes, dots and parentheses
+NON_PHONE_CHARS = re.compile(r"[^\d+]")
+
+# A compacted Saudi mobile number; the group is the 9-digit subscriber number
+SAUDI_MOBILE_PATTERN = re.compile(r"^(?:\+966|00966|966)?0?(5\d{8})$")
+
+SAUDI_PREFIX = "+966"
+
+# Joins the line groups of a batch; no phone pattern matches across it
+GROUP_SEPARATOR = "\0"
+
+
+def normalize_phone(raw):
+    """
+    Normalize one phone string: Saudi mobiles become +966XXXXXXXXX, anything else
+    keeps only its digits and "+". Values without digits (e.g. "N/A") are returned as-is.
+    """
+    compact = NON_PHONE_CHARS.sub("", raw or "")
+    match = SAUDI_MOBILE_PATTERN.match(compact)
+    if match:
+        return SAUDI_PREFIX + match.group(1)
+    return compact or raw or ""
+
+
+def extract_phones(line_groups):
+    """
+    Return the normalized phone of each group of candidate lines (the first lines of
+    one CV), or "N/A". A Saudi mobile anywhere in the group wins over other numbers.
+    All groups are searched for Saudi mobiles in one regex pass over their joined text,
+    and each distinct raw match is normalized once.
+    """
+    texts = ["\n".join(lines) for lines in line_groups]
+    starts = list(itertools.accumulate((len(text) + 1 for text in texts[:-1]), initial=0))
+    text = GROUP_SEPARATOR.join(texts)
+    found = [None] * len(texts)
+
+    for match in PHONE_REGEX.finditer(text):
+        group = bisect.bisect_right(starts, match.start()) - 1
+        if found[group] is None:
+            found[group] = match.group()
+
+    # Only the groups without a Saudi mobile are searched for other numbers
+    for group, raw in enumerate(found):
+        if raw is None:
+            for match in PHONE_PATTERN.findall(texts[group]):
+                if len(NON_DIGIT.sub("", match)) >= MIN_PHONE_DIGITS:
+                    found[group] = match
+                    break
+
+    normalized = {}
+    phones = []
+    for raw in found:
+        if raw is None:
+            phones.append("N/A")
+            continue
+        if raw not in normalized:
+            normalized[raw] = normalize_phone(raw)
+        phones.append(normalized[raw])
+    return phones
+
+
+class CommitBatcher:
+    """
+    Commits a SQLite connection once every `every` writes instead of after each one.
+    """
+
+    def __init__(self, conn, every):
+        self.conn = conn
+        self.every = every
+        self.pending = 0
+
+    def wrote(self):
+        self.pending += 1
+        if self.pending >= self.every:
+            self.commit()
+
+    def commit(self):
+        self.conn.commit()
+        self.pending = 0
+
+
+def file_digest(file_path, chunk_size=1024 * 1024):
+    """
+    Return the SHA-1 hex digest of a file's content.
+    """
+    digest = hashlib.sha1()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Punctuation the link regex picks up from surrounding text
+LINK_TRAILING_PUNCTUATION = ".,;:!?)]}>\"'|"
+LINK_SEPARATORS = re.compile(r"[,;|\s]")  # between links pasted on one line; never part of a URL
+LINKEDIN_HOST = "www.linkedin.com"
+
+
+def canonicalize_linkedin_url(url):
+    """
+    Reduce a LinkedIn URL to one canonical form so the same profile is checked once.
+    Normalizes scheme, host and country subdomains (sa.linkedin.com), case,
+    query strings, fragments, trailing slashes and trailing punctuation.
+    Anything after a comma, semicolon or pipe (another link on the same line) is dropped.
+    Profile URLs are cut down to https://www.linkedin.com/in/<slug>.
+    """
+    url = LINK_SEPARATORS.split(url.strip(), 1)[0].rstrip(LINK_TRAILING_PUNCTUATION)
+    if "://" not in url:
+        url = "https://" + url
+
+    parts = urlsplit(url)
+    host = parts.netloc.lower().rsplit("@", 1)[-1].split(":", 1)[0]
+    if host != "linkedin.com" and not host.endswith(".linkedin.com"):
+        return url
+
+    segments = [s for s in parts.path.lower().split("/") if s]
+    if len(segments) >= 2 and segments[0] == "in":
+        segments = segments[:2]
+    path = "/".join(segments)
+    return f"https://{LINKEDIN_HOST}/{path}" if path else f"https://{LINKEDIN_HOST}"
+
+
+def unique_linkedin_urls(urls):
+    """
+    Canonicalize URLs and drop duplicates, keeping the first occurrence order.
+    """
+    seen = {}
+    for url in urls:
+        seen.setdefault(canonicalize_linkedin_url(url), None)
+    return list(seen)
 
-def extract_phone_from_text(text_lines):
-    """
-    Extracts the first valid Saudi phone number from the first 5 lines.
-    Normalizes the number to +966XXXXXXXXX format.
-    """
-    for line in text_lines[:5]:
-        match = PHONE_REGEX.search(line)
-        if match:
-            raw = match.group()
-            # Remove spaces, dashes, parentheses
-            phone = re.sub(r"[^\d+]", "", raw)
-
-            # Normalize
-            if phone.startswith("05"):  # local format
-                phone = "+966" + phone[1:]
-            elif phone.startswith("5"):  # missing 0
-                phone = "+966" + phone
-            elif phone.startswith("+9660"):  # wrong extra 0
-                phone = "+966" + phone[5:]
-            elif phone.startswith("(+966)"):  # with parentheses
-                phone = "+966" + phone[5:]
-
-            # Validation: لازم يكون 13 خانة مع +966
-            digits = re.sub(r"\D", "", phone)
-            if len(digits) == 12:  # 966 + 9 digits
-                return phone
-    return None
 
+def is_profile_url(url):
+    """
+    True if the URL points at a member profile (/in/...), i.e. LinkedIn did not
+    redirect the request to a login wall, a 404 page or somewhere else.
+    """
+    return urlsplit(url).path.lower().startswith("/in/")
+
+
+DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_duration(value):
+    """
+    Parse a duration such as "90s", "30m", "12h" or "7d" into seconds.
+    A bare number is taken as hours.
+    """
+    value = str(value).strip().lower()
+    unit = value[-1:] if value[-1:] in DURATION_UNITS else "h"
+    number = value[:-1] if value[-1:] in DURATION_UNITS else value
+    try:
+        seconds = float(number) * DURATION_UNITS[unit]
+    except ValueError:
+        raise ValueError(f"Invalid duration: {value!r}")
+    if seconds < 0:
+        raise ValueError(f"Invalid duration: {value!r}")
+    return seconds
+
+
+def parse_shard(value):
+    """
+    Parse a shard spec "i/n" (1 <= i <= n) into (i, n).
+    """
+    try:
+        index, count = (int(part) for part in str(value).split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard: {value!r}")
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard: {value!r}")
+    return index, count
+
+
+def positive_int(value):
+    """
+    Parse a whole number greater than zero (session counts and the like).
+    """
+    number = int(value)
+    if number <= 0:
+        raise ValueError(f"Must be greater than zero: {value!r}")
+    return number
+
+
+def positive_float(value):
+    """
+    Parse a number greater than zero (rates and the like).
+    """
+    number = float(value)
+    if number <= 0:
+        raise ValueError(f"Must be greater than zero: {value!r}")
+    return number
+
+
+def shard_of(relative_path, count):
+    """
+    Stable 1-based shard of a path relative to the scanned folder. Separators are
+    normalized so Windows and Linux hosts agree on the split.
+    """
+    key = relative_path.replace("\\", "/").encode("utf-8")
+    return int(hashlib.sha1(key).hexdigest()[:8], 16) % count + 1
 
 
 def timing(logger: Logger):
@@ -0,0 +1,238 @@
+# watcher.py
+import os
+import time
+import threading
+from file_reader import (
+    iter_docx_files, is_excluded_name, extract_contact_info, stream_contact_info, ContactRecord
+)
+from result_table import ResultTable
+from utils import file_digest
+
+# The watch journal is rewritten once it holds this many times the current rows
+JOURNAL_COMPACT_RATIO = 2
+
+# watchdog (inotify on Linux, ReadDirectoryChangesW on Windows) is optional; without it the tree is polled
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+
+def is_watched_file(path, root, exclude_patterns):
+    """
+    True for DOCX files the batch walk would also pick up (same exclusions, no lock files).
+    """
+    name = os.path.basename(path)
+    if not name.lower().endswith(".docx") or name.startswith("~$"):
+        return False
+    relative = os.path.relpath(path, root)
+    return not any(is_excluded_name(part, exclude_patterns) for part in relative.split(os.sep))
+
+
+class ChangeTracker:
+    """
+    Collects changed and deleted paths from either watcher and hands them out
+    once they have been quiet for `settle` seconds (i.e. the copy finished).
+    """
+
+    def __init__(self, root, exclude_patterns, settle):
+        self.root = root
+        self.exclude_patterns = exclude_patterns
+        self.settle = settle
+        self.lock = threading.Lock()
+        self.changed = {}
+        self.deleted = set()
+
+    def mark_changed(self, path):
+        if is_watched_file(path, self.root, self.exclude_patterns):
+            with self.lock:
+                self.changed[path] = time.monotonic()
+                self.deleted.discard(path)
+
+    def mark_deleted(self, path):
+        with self.lock:
+            self.changed.pop(path, None)
+            self.deleted.add(path)
+
+    def mark_tree(self, directory):
+        for path in iter_docx_files(directory, self.exclude_patterns):
+            self.mark_changed(path)
+
+    def pop_ready(self):
+        """
+        Return (settled changed paths, deleted paths) and forget them.
+        """
+        now = time.monotonic()
+        with self.lock:
+            ready = [p for p, seen in self.changed.items() if now - seen >= self.settle]
+            for path in ready:
+                del self.changed[path]
+            deleted, self.deleted = self.deleted, set()
+        return ready, deleted
+
+
+class _EventHandler(FileSystemEventHandler):
+    def __init__(self, tracker):
+        super().__init__()
+        self.tracker = tracker
+
+    def on_created(self, event):
+        if event.is_directory:
+            self.tracker.mark_tree(event.src_path)
+        else:
+            self.tracker.mark_changed(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.tracker.mark_changed(event.src_path)
+
+    def on_moved(self, event):
+        self.tracker.mark_deleted(event.src_path)
+        if event.is_directory:
+            self.tracker.mark_tree(event.dest_path)
+        else:
+            self.tracker.mark_changed(event.dest_path)
+
+    def on_deleted(self, event):
+        # A deleted folder takes every CV under it along (see _drop_rows)
+        self.tracker.mark_deleted(event.src_path)
+
+
+def _snapshot(root, exclude_patterns):
+    snapshot = {}
+    for path in iter_docx_files(root, exclude_patterns):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        snapshot[path] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+
+def _poll(tracker, interval, stop):
+    """
+    Polling fallback: rescan the tree every `interval` seconds and diff size/mtime.
+    """
+    previous = _snapshot(tracker.root, tracker.exclude_patterns)
+    while not stop.wait(interval):
+        current = _snapshot(tracker.root, tracker.exclude_patterns)
+        for path, signature in current.items():
+            if previous.get(path) != signature:
+                tracker.mark_changed(path)
+        for path in previous.keys() - current.keys():
+            tracker.mark_deleted(path)
+        previous = current
+
+
+def _drop_rows(rows_by_path, path):
+    """
+    Forget the rows of a deleted or moved path: the file itself, or every file under a folder.
+    """
+    prefix = path.rstrip(os.sep) + os.sep
+    for known in [p for p in rows_by_path if p == path or p.startswith(prefix)]:
+        del rows_by_path[known]
+
+
+def _parse(path):
+    started = time.perf_counter()
+    phone, links = extract_contact_info(path)
+    parse_seconds = time.perf_counter() - started
+    return ContactRecord(path, phone, links, file_digest(path), parse_seconds)
+
+
+def watch_folder(folder_path, verifier, exclude_patterns, on_update, workers=None,
+                 poll_interval=5.0, settle=2.0, use_polling=False):
+    """
+    Verify every CV under folder_path once, then keep the checker session open and
+    verify DOCX files as they are created or modified, until interrupted.
+    `on_update(results)` receives the current results after the first pass and after
+    every batch of changes or retries. Uses watchdog when installed, otherwise polls.
+    Links that failed transiently are retried from the loop once their backoff is over,
+    so the loop never sleeps through a retry delay.
+    """
+    rows_by_path = {}
+    retry_attempt = 0
+    retry_at = None
+
+    def add_rows(rows):
+        for row in rows:
+            # Skip late results for files deleted in the meantime
+            if row.full_path in rows_by_path:
+                rows_by_path[row.full_path].append(row)
+
+    def publish():
+        nonlocal retry_attempt, retry_at
+        if not verifier.pending:
+            retry_attempt = 0
+        elif retry_at is None and retry_attempt < verifier.retries:
+            delay = verifier.retry_backoff * 2 ** retry_attempt
+            retry_at = time.monotonic() + delay
+            print(f"[INFO] Retrying {len(verifier.pending)} profiles in {delay:g}s "
+                  f"(attempt {retry_attempt + 1}/{verifier.retries})")
+        elif retry_at is None:
+            add_rows(verifier.give_up())
+            retry_attempt = 0
+
+        table = ResultTable(row for rows in rows_by_path.values() for row in rows)
+        if verifier.journal.lines > JOURNAL_COMPACT_RATIO * max(len(table), 1):
+            verifier.journal.compact([row.as_dict() for row in table])
+        on_update(table)
+
+    files = iter_docx_files(folder_path, exclude_patterns)
+    for record in stream_contact_info(files, workers=workers, lookup=verifier.lookup):
+        rows_by_path[record.file_path] = verifier.handle(record)
+    publish()
+
+    # From here on, a modified file must be checked again even if a resumed journal had it
+    verifier.completed = set()
+
+    tracker = ChangeTracker(folder_path, exclude_patterns, settle)
+    stop = threading.Event()
+    observer = None
+    if Observer is not None and not use_polling:
+        observer = Observer()
+        observer.schedule(_EventHandler(tracker), folder_path, recursive=True)
+        observer.start()
+        print(f"[INFO] Watching {folder_path} for new CVs (file system events).")
+    else:
+        threading.Thread(target=_poll, args=(tracker, poll_interval, stop), daemon=True).start()
+        print(f"[INFO] Watching {folder_path} for new CVs (polling every {poll_interval:g}s).")
+
+    try:
+        while True:
+            time.sleep(0.5)
+            changed, deleted = tracker.pop_ready()
+            retry_due = retry_at is not None and time.monotonic() >= retry_at
+            if not changed and not deleted and not retry_due:
+                continue
+
+            # Each batch checks a profile at most once; older results come from the profile cache
+            verifier.checked.clear()
+            for path in deleted:
+                _drop_rows(rows_by_path, path)
+            for path in changed:
+                try:
+                    if os.path.getsize(path) == 0:
+                        continue
+                    record = _parse(path)
+                except OSError:
+                    rows_by_path.pop(path, None)
+                    continue
+                rows_by_path[path] = verifier.handle(record)
+                print(f"[INFO] Verified {path}")
+
+            if retry_due:
+                retry_at = None
+                retry_attempt += 1
+                add_rows(verifier.retry_round())
+
+            # The daemon's state lives in rows_by_path; don't let the batch list grow forever
+            verifier.results.clear()
+            publish()
+    finally:
+        stop.set()
+        if observer is not None:
+            observer.stop()
+            observer.join()